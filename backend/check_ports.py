@@ -5,40 +5,106 @@ Port Availability Checker for VPS Deployment
 Checks which ports are available and suggests safe alternatives
 """
 
+import os
+import re
+import shutil
 import socket
 import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-def check_port_available(port):
-    """Check if a port is available"""
+# Probe results are reused for this many seconds within a run
+PROBE_CACHE_TTL_SECONDS = 2
+
+# Number of ports probed concurrently during the fallback sweep
+PROBE_BATCH_SIZE = 64
+
+# Port of the local address (4th column) on LISTEN lines of ss/netstat output
+_LISTEN_RE = re.compile(rb'^(?=.*LISTEN)(?:\S+\s+){3}\S*:(\d+)\s', re.MULTILINE)
+
+# Patterns rewritten by update_config_port
+_API_PORT_RE = re.compile(r'API_PORT=\d+')
+# Literal prefixes in deploy.py that are followed by the port number
+_DEPLOY_PORT_PREFIXES = ('http://178.32.191.152:', '"--port", "')
+
+def _try_bind(port, socktype):
+    """Try to bind a socket of the given type to the port on all interfaces"""
+    sock = socket.socket(socket.AF_INET, socktype)
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(1)
-            result = sock.connect_ex(('localhost', port))
-            return result != 0  # Port is available if connection fails
-    except Exception:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('0.0.0.0', port))
         return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+@lru_cache(maxsize=4096)
+def _probe(port, _epoch):
+    """Bind-probe a port; _epoch only exists to expire cached results"""
+    # Binding fails immediately with EADDRINUSE, unlike a connect probe which
+    # can stall on the timeout; 0.0.0.0 matches the uvicorn --host bind.
+    # UDP is probed too since monitoring/streaming sidecars may bind it.
+    return _try_bind(port, socket.SOCK_STREAM) and _try_bind(port, socket.SOCK_DGRAM)
+
+def check_port_available(port):
+    """Check if a port is available for both TCP and UDP"""
+    return _probe(port, int(time.monotonic() // PROBE_CACHE_TTL_SECONDS))
+
+PROC_NET_TCP_FILES = ('/proc/net/tcp', '/proc/net/tcp6')
+TCP_LISTEN_STATE = '0A'
+
+def _get_proc_listening_ports():
+    """Read listening TCP ports straight from /proc/net (Linux only)"""
+    ports = set()
+    for proc_file in PROC_NET_TCP_FILES:
+        try:
+            with open(proc_file) as f:
+                next(f, None)  # Skip header
+                for line in f:
+                    parts = line.split()
+                    if len(parts) > 3 and parts[3] == TCP_LISTEN_STATE:
+                        # local_address is HEXIP:HEXPORT
+                        ports.add(int(parts[1].split(':')[1], 16))
+        except FileNotFoundError:
+            # tcp6 may be missing when IPv6 is disabled; only give up
+            # entirely if neither table exists
+            if proc_file == PROC_NET_TCP_FILES[0]:
+                raise
+    return sorted(ports)
 
 def get_listening_ports():
     """Get list of ports currently in use"""
     try:
-        result = subprocess.run(['netstat', '-tlnp'], capture_output=True, text=True)
-        lines = result.stdout.split('\n')
-        ports = []
-        for line in lines:
-            if 'LISTEN' in line:
-                parts = line.split()
-                if len(parts) >= 4:
-                    address = parts[3]
-                    if ':' in address:
-                        port = address.split(':')[-1]
-                        if port.isdigit():
-                            ports.append(int(port))
+        # Avoid forking a subprocess when the kernel tables are readable
+        return _get_proc_listening_ports()
+    except OSError:
+        pass
+
+    try:
+        try:
+            # ss reads sockets over netlink and is much faster than netstat;
+            # -H drops the header and -l restricts output to listeners
+            result = subprocess.run(['ss', '-Htln'], capture_output=True)
+        except FileNotFoundError:
+            result = subprocess.run(['netstat', '-tlnp'], capture_output=True)
+        ports = [int(port) for port in _LISTEN_RE.findall(result.stdout)]
         return sorted(set(ports))
     except Exception:
         return []
 
-def find_safe_ports(preferred_ports=[8001, 8002, 8003, 8080, 8081]):
+def _probe_ports(ports):
+    """Probe ports concurrently, returning availability in input order"""
+    ports = list(ports)
+    if not ports:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(ports))) as executor:
+        return list(executor.map(check_port_available, ports))
+
+def find_safe_ports(preferred_ports=(8001, 8002, 8003, 8080, 8081)):
     """Find safe ports to use"""
     print("🔍 Checking port availability...")
     print("=" * 40)
@@ -46,14 +112,25 @@ def find_safe_ports(preferred_ports=[8001, 8002, 8003, 8080, 8081]):
     listening_ports = get_listening_ports()
     if listening_ports:
         print(f"📡 Ports currently in use: {', '.join(map(str, listening_ports))}")
+        listening_set = set(listening_ports)
+        preferred_status = [port not in listening_set for port in preferred_ports]
+        # LISTEN only shows TCP listeners; bind-probe candidates until one is
+        # confirmed, catching bound-but-idle TCP and UDP sockets
+        for i, port in enumerate(preferred_ports):
+            if preferred_status[i]:
+                if check_port_available(port):
+                    break
+                preferred_status[i] = False
     else:
         print("📡 Could not detect listening ports (netstat might not be available)")
+        # Nothing to look up, so probe each port directly
+        listening_set = None
+        preferred_status = _probe_ports(preferred_ports)
     
     print("\n🎯 Checking preferred ports:")
     available_ports = []
     
-    for port in preferred_ports:
-        is_available = check_port_available(port)
+    for port, is_available in zip(preferred_ports, preferred_status):
         status = "✅ Available" if is_available else "❌ In use"
         print(f"  Port {port}: {status}")
         if is_available:
@@ -66,14 +143,62 @@ def find_safe_ports(preferred_ports=[8001, 8002, 8003, 8080, 8081]):
     else:
         print("\n⚠️  All preferred ports are in use")
         # Try to find an available port in range 8000-9000
-        for port in range(8000, 9001):
-            if check_port_available(port):
-                print(f"🎉 Alternative port found: {port}")
-                return port
+        if listening_set is not None:
+            port = next((p for p in range(8000, 9001)
+                         if p not in listening_set and check_port_available(p)), None)
+        else:
+            port = None
+            for start in range(8000, 9001, PROBE_BATCH_SIZE):
+                batch = range(start, min(start + PROBE_BATCH_SIZE, 9001))
+                port = next((p for p, ok in zip(batch, _probe_ports(batch)) if ok), None)
+                if port is not None:
+                    break
+        
+        if port is not None:
+            print(f"🎉 Alternative port found: {port}")
+            return port
         
         print("❌ No available ports found in range 8000-9000")
         return None
 
+def _write_atomic(path, content):
+    """Write content to a temp file and swap it into place, keeping the file mode"""
+    # A unique temp name per run, next to the target so the replace stays
+    # on one filesystem
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(path)),
+                                     prefix=f".{os.path.basename(path)}.", delete=False) as f:
+        tmp_path = f.name
+        f.write(content)
+    try:
+        try:
+            # The temp file is created 0600; carry over e.g. deploy.py's exec bit
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _replace_port_suffix(text, prefix, new_port):
+    """Replace the digits following every occurrence of prefix with new_port"""
+    new_port = str(new_port)
+    parts = []
+    pos = 0
+    idx = text.find(prefix)
+    while idx != -1:
+        start = idx + len(prefix)
+        end = start
+        while end < len(text) and text[end].isdigit():
+            end += 1
+        if end > start:
+            parts.append(text[pos:start])
+            parts.append(new_port)
+            pos = end
+        idx = text.find(prefix, end)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
 def update_config_port(port):
     """Update the configuration with the recommended port"""
     try:
@@ -82,11 +207,8 @@ def update_config_port(port):
             content = f.read()
         
         # Replace the port
-        import re
-        content = re.sub(r'API_PORT=\d+', f'API_PORT={port}', content)
-        
-        with open('.env.production', 'w') as f:
-            f.write(content)
+        content = _API_PORT_RE.sub(f'API_PORT={port}', content)
+        _write_atomic('.env.production', content)
         
         print(f"✅ Updated .env.production with port {port}")
         
@@ -95,11 +217,9 @@ def update_config_port(port):
             deploy_content = f.read()
         
         # Replace port references in deploy.py
-        deploy_content = re.sub(r'http://178\.32\.191\.152:\d+', f'http://178.32.191.152:{port}', deploy_content)
-        deploy_content = re.sub(r'"--port", "\d+"', f'"--port", "{port}"', deploy_content)
-        
-        with open('deploy.py', 'w') as f:
-            f.write(deploy_content)
+        for prefix in _DEPLOY_PORT_PREFIXES:
+            deploy_content = _replace_port_suffix(deploy_content, prefix, port)
+        _write_atomic('deploy.py', deploy_content)
             
         print(f"✅ Updated deploy.py with port {port}")
         return True
@@ -6,7 +6,8 @@ Production-grade configuration with environment-specific settings
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from functools import lru_cache
 import os
 
 
@@ -100,14 +101,14 @@ class AppConfig(BaseSettings):
     api_port: int = Field(default=8000, env="API_PORT")
     
     # CORS Settings
-    cors_origins: List[str] = Field(
-        default=[
+    cors_origins: Tuple[str, ...] = Field(
+        default=(
             "http://localhost:3000", 
             "http://localhost:5173", 
             "http://localhost:5174",
             "https://etl-pipeline-snowy.vercel.app",
             "https://etl-pipeline-snowy.vercel.app/"
-        ],
+        ),
         env="CORS_ORIGINS"
     )
     
@@ -120,12 +121,12 @@ class AppConfig(BaseSettings):
     # Security
     secret_key: str = Field(default="dev-secret-key-change-in-production", env="SECRET_KEY")
     
-    # Component Configurations
-    database: DatabaseConfig = DatabaseConfig()
-    redis: RedisConfig = RedisConfig()
-    pipeline: PipelineConfig = PipelineConfig()
-    streaming: StreamingConfig = StreamingConfig()
-    monitoring: MonitoringConfig = MonitoringConfig()
+    # Component Configurations (built per AppConfig, not at import time)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    redis: RedisConfig = Field(default_factory=RedisConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    streaming: StreamingConfig = Field(default_factory=StreamingConfig)
+    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
     
     class Config:
         env_file = ".env"
@@ -134,12 +135,7 @@ class AppConfig(BaseSettings):
         extra = "allow"
 
 
-# Global configuration instance
-config = None
-
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
     """Get application configuration"""
-    global config
-    if config is None:
-        config = AppConfig()
-    return config
\ No newline at end of file
+    return AppConfig()
\ No newline at end of file
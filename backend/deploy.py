@@ -5,22 +5,21 @@ VPS Deployment Script for ETL Pipeline Backend
 Production deployment script for running on VPS server 178.32.191.152
 """
 
-import subprocess
+import importlib.util
+import shutil
 import sys
 import os
 from pathlib import Path
 
 def check_requirements():
     """Check if all required dependencies are installed"""
-    try:
-        import uvicorn
-        import fastapi
-        import sqlalchemy
-        print("✅ Core dependencies found")
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("Run: pip install -r requirements.txt")
-        return False
+    # find_spec locates the packages without executing their import trees
+    for name in ("uvicorn", "fastapi", "sqlalchemy"):
+        if importlib.util.find_spec(name) is None:
+            print(f"❌ Missing dependency: {name}")
+            print("Run: pip install -r requirements.txt")
+            return False
+    print("✅ Core dependencies found")
     return True
 
 def setup_environment():
@@ -31,23 +30,42 @@ def setup_environment():
         return False
     
     # Copy production env to .env
-    subprocess.run(["cp", ".env.production", ".env"], check=True)
+    try:
+        shutil.copyfile(env_file, ".env")
+    except OSError as e:
+        print(f"❌ Failed to copy .env.production: {e}")
+        return False
     print("✅ Production environment configured")
     return True
 
 def check_database():
     """Check database connectivity"""
+    # Talk to psycopg2 directly rather than importing the app config and
+    # SQLAlchemy just to run SELECT 1
     try:
-        from config import get_config
-        from etl.load import connect_to_postgres
-        
-        config = get_config()
-        engine = connect_to_postgres()
+        import psycopg2
+        from dotenv import dotenv_values
         
-        with engine.connect() as conn:
-            result = conn.execute("SELECT 1")
-            print("✅ Database connection successful")
-            return True
+        # Resolve settings the way config.py does: environment variables
+        # over .env, then the same defaults. dotenv gives None for bare keys
+        env = {key: value for key, value in dotenv_values(".env").items() if value is not None}
+        env.update(os.environ)
+        conn = psycopg2.connect(
+            host=env.get("DB_HOST", "localhost"),
+            port=int(env.get("DB_PORT", 5432)),
+            dbname=env.get("DB_NAME", "etl_portfolio"),
+            user=env.get("DB_USER", "postgres"),
+            password=env.get("DB_PASSWORD", "password"),
+            connect_timeout=3
+        )
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+        finally:
+            conn.close()
+        print("✅ Database connection successful")
+        return True
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         return False
@@ -58,14 +76,20 @@ def start_server():
     print("📡 Server will be available at: http://178.32.191.152:8001")
     print("📖 API Documentation: http://178.32.191.152:8001/docs")
     
-    # Start uvicorn server
-    subprocess.run([
+    # Replace this process with uvicorn so signals reach it directly;
+    # flush first since exec discards anything still buffered
+    # uvloop/httptools ship with uvicorn[standard] (see requirements.txt)
+    sys.stdout.flush()
+    os.execvp("uvicorn", [
         "uvicorn", "main:app",
         "--host", "0.0.0.0",
         "--port", "8001", 
         "--workers", "4",
+        "--loop", "uvloop",
+        "--http", "httptools",
+        "--backlog", "2048",
         "--log-level", "info"
-    ])
+    ])  # Does not return
 
 def main():
     """Main deployment function"""
@@ -6,14 +6,72 @@ Production-grade data quality monitoring with comprehensive metrics
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable
+from dataclasses import dataclass, field, asdict
+from functools import cached_property
 from enum import Enum
 import re
+import os
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import structlog
 
 
+def _fast_null_count(series: pd.Series) -> int:
+    """Count nulls straight from the NumPy buffer where the dtype allows it"""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in 'iub':
+            # Integer and boolean arrays cannot hold NaN
+            return 0
+        if dtype.kind in 'fc':
+            return int(np.isnan(series.to_numpy(copy=False)).sum())
+        if dtype.kind in 'mM':
+            return int(np.isnat(series.to_numpy(copy=False)).sum())
+    return int(series.isna().sum())
+
+
+# HyperLogLog with 2**14 registers: ~0.8% standard error in 16KB
+_HLL_PRECISION = 14
+# Below this many rows exact distinct counts are cheap enough to keep
+_APPROXIMATE_PROFILE_MIN_ROWS = 100_000
+# Below this many rows thread startup costs more than running rules in turn
+_PARALLEL_RULES_MIN_ROWS = 1_000_000
+# Rule types that only read counts precomputed by assess_data_quality
+_PRECOMPUTED_RULE_TYPES = frozenset({'null_percentage', 'duplicate_percentage', 'data_type'})
+
+
+def _approximate_distinct_count(series: pd.Series) -> int:
+    """Estimate the number of distinct non-null values with HyperLogLog"""
+    values = series.dropna()
+    if len(values) == 0:
+        return 0
+    
+    p = _HLL_PRECISION
+    m = 1 << p
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    
+    # Top p bits pick the register; the rank is the position of the first
+    # set bit in the remaining 64 - p bits (exact in float64's mantissa)
+    registers_idx = (hashes >> np.uint64(64 - p)).astype(np.intp)
+    remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+    _, bit_length = np.frexp(remainder.astype(np.float64))
+    ranks = ((64 - p) - bit_length + 1).astype(np.uint8)
+    
+    registers = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registers, registers_idx, ranks)
+    
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.ldexp(1.0, -registers.astype(np.int64)).sum()
+    empty_registers = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and empty_registers > 0:
+        # Small-range correction (linear counting)
+        estimate = m * np.log(m / empty_registers)
+    
+    return min(int(round(estimate)), len(values))
+
+
 class ValidationSeverity(Enum):
     INFO = "info"
     WARNING = "warning"
@@ -21,6 +79,24 @@ class ValidationSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Positional index of each severity into DataQualityAssessor._severity_weight_arr
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(ValidationSeverity)}
+
+
+# dtype.kind codes standing in for the pd.api.types predicates
+_NUMERIC_KINDS = frozenset('biufc')
+_STRING_KINDS = frozenset('OSU')
+_DATETIME_KINDS = frozenset('M')
+_FIXED_WIDTH_KINDS = _NUMERIC_KINDS | frozenset('mM')
+
+# dtype kinds accepted for each expected type in the data type rule
+_EXPECTED_TYPE_KINDS = {
+    'numeric_or_string': _NUMERIC_KINDS | _STRING_KINDS,
+    'numeric': _NUMERIC_KINDS,
+    'datetime': _DATETIME_KINDS,
+}
+
+
 class DataType(Enum):
     INTEGER = "integer"
     FLOAT = "float"
@@ -31,7 +107,7 @@ class DataType(Enum):
     PHONE = "phone"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """Data validation rule definition"""
     name: str
@@ -47,7 +123,7 @@ class ValidationRule:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a data validation check"""
     rule_name: str
@@ -68,14 +144,28 @@ class ValidationResult:
             self.failed_percentage = (self.failed_count / self.total_count) * 100
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['severity'] = self.severity.value
-        return data
+        # Built by hand: asdict() deep-copies every field recursively
+        return {
+            'rule_name': self.rule_name,
+            'column': self.column,
+            'passed': self.passed,
+            'severity': self.severity.value,
+            'message': self.message,
+            'failed_count': self.failed_count,
+            'total_count': self.total_count,
+            'failed_percentage': self.failed_percentage,
+            'sample_failed_values': list(self.sample_failed_values)
+        }
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataQualityReport:
-    """Comprehensive data quality assessment report"""
+    """Comprehensive data quality assessment report
+    
+    Null percentages and column profiles are computed on first access, so
+    callers that only read the quality score never pay for profiling. Each
+    factory is released once it has run, and with it the assessed frame.
+    """
     dataset_name: str
     total_records: int
     total_columns: int
@@ -84,22 +174,42 @@ class DataQualityReport:
     timestamp: datetime
     
     # Summary Statistics
-    null_percentages: Dict[str, float]
     duplicate_count: int
     duplicate_percentage: float
     
-    # Data Profiling
-    column_profiles: Dict[str, Dict[str, Any]]
+    # Deferred Summary Statistics and Data Profiling
+    null_percentages_factory: Callable[[], Dict[str, float]] = field(repr=False, compare=False)
+    column_profiles_factory: Callable[[], Dict[str, Dict[str, Any]]] = field(repr=False, compare=False)
     
     def __post_init__(self):
-        if not hasattr(self, 'timestamp') or not self.timestamp:
-            self.timestamp = datetime.now()
+        if not self.timestamp:
+            object.__setattr__(self, 'timestamp', datetime.now())
+    
+    @cached_property
+    def null_percentages(self) -> Dict[str, float]:
+        null_percentages = self.null_percentages_factory()
+        object.__setattr__(self, 'null_percentages_factory', None)
+        return null_percentages
+    
+    @cached_property
+    def column_profiles(self) -> Dict[str, Dict[str, Any]]:
+        column_profiles = self.column_profiles_factory()
+        object.__setattr__(self, 'column_profiles_factory', None)
+        return column_profiles
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['validation_results'] = [r.to_dict() for r in self.validation_results]
-        return data
+        return {
+            'dataset_name': self.dataset_name,
+            'total_records': self.total_records,
+            'total_columns': self.total_columns,
+            'validation_results': [r.to_dict() for r in self.validation_results],
+            'overall_quality_score': self.overall_quality_score,
+            'timestamp': self.timestamp.isoformat(),
+            'null_percentages': self.null_percentages,
+            'duplicate_count': self.duplicate_count,
+            'duplicate_percentage': self.duplicate_percentage,
+            'column_profiles': self.column_profiles
+        }
 
 
 class DataQualityAssessor:
@@ -108,6 +218,18 @@ class DataQualityAssessor:
     def __init__(self):
         self.logger = structlog.get_logger()
         self.default_rules = self._create_default_rules()
+        self._regex_cache: Dict[str, re.Pattern] = {}
+        # Expected type per well-known (lower-cased) column name
+        self._expected_types = {
+            'id': 'numeric_or_string',
+            'user_id': 'numeric_or_string',
+            'age': 'numeric',
+            'date': 'datetime',
+            'created_at': 'datetime',
+            'updated_at': 'datetime',
+        }
+        # Quality score weights, ordered as ValidationSeverity members
+        self._severity_weight_arr = np.array([0.1, 0.3, 0.7, 1.0])
     
     def _create_default_rules(self) -> List[ValidationRule]:
         """Create default validation rules"""
@@ -142,9 +264,14 @@ class DataQualityAssessor:
         self, 
         df: pd.DataFrame, 
         dataset_name: str = "unknown",
-        custom_rules: Optional[List[ValidationRule]] = None
+        custom_rules: Optional[List[ValidationRule]] = None,
+        approximate: bool = False
     ) -> DataQualityReport:
-        """Perform comprehensive data quality assessment"""
+        """Perform comprehensive data quality assessment
+        
+        With approximate=True, distinct counts of numeric and datetime
+        columns in frames over 100k rows are HyperLogLog estimates.
+        """
         
         self.logger.info(f"Starting data quality assessment for {dataset_name}")
         
@@ -153,25 +280,72 @@ class DataQualityAssessor:
         if custom_rules:
             rules.extend(custom_rules)
         
-        # Run validations
-        validation_results = []
-        for rule in rules:
+        # Null counts are shared by the null rules, profiling and the summary
+        null_counts = self._count_nulls(df)
+        
+        # Rules on columns the frame does not have fail without being dispatched
+        present_columns = set(df.columns)
+        missing_column_rules = {
+            id(rule) for rule in rules
+            if rule.rule_type in self._COLUMN_RULE_TYPES
+            and rule.column != "*"
+            and rule.column not in present_columns
+        }
+        
+        # Duplicates from one hashing pass, shared by the rule and the summary
+        duplicate_count = self._count_duplicate_rows(df)
+        
+        # Column dtype kinds, read once for type checks and profiling
+        dtype_kinds = self._dtype_kinds(df)
+        
+        # Run validations; rules are independent and pandas/NumPy kernels
+        # release the GIL, so several rules scanning a large frame run on a
+        # thread pool. The default rules only read precomputed counts
+        def run_rule(rule: ValidationRule) -> Optional[ValidationResult]:
+            if id(rule) in missing_column_rules:
+                return self._missing_column_result(rule)
             try:
-                result = self._execute_validation_rule(df, rule)
-                if result:
-                    validation_results.append(result)
+                return self._execute_validation_rule(
+                    df, rule,
+                    null_counts=null_counts,
+                    duplicate_count=duplicate_count,
+                    dtype_kinds=dtype_kinds
+                )
             except Exception as e:
                 self.logger.error(f"Error executing rule {rule.name}: {e}")
+                return None
+        
+        scanning_rules = sum(
+            1 for rule in rules
+            if rule.rule_type not in _PRECOMPUTED_RULE_TYPES and id(rule) not in missing_column_rules
+        )
+        workers = min(scanning_rules, os.cpu_count() or 1)
+        if workers < 2 or len(df) < _PARALLEL_RULES_MIN_ROWS:
+            outcomes = [run_rule(rule) for rule in rules]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(run_rule, rules))
+        validation_results = [result for result in outcomes if result]
         
         # Calculate overall quality score
         quality_score = self._calculate_quality_score(validation_results, df)
         
-        # Generate data profiling
-        column_profiles = self._generate_column_profiles(df)
+        # Data profiling is deferred until the report is asked for it.
+        # Low-cardinality string columns are profiled as categoricals, so
+        # hashing-heavy work runs on integer codes; df itself stays untouched
+        def make_column_profiles() -> Dict[str, Dict[str, Any]]:
+            categorical_view = self._to_categorical_view(df, dtype_kinds=dtype_kinds)
+            return self._generate_column_profiles(
+                df, categorical_view,
+                null_counts=null_counts,
+                dtype_kinds=dtype_kinds,
+                approximate=approximate
+            )
+        
+        def make_null_percentages() -> Dict[str, float]:
+            return self._calculate_null_percentages(df, null_counts=null_counts)
         
         # Calculate summary statistics
-        null_percentages = self._calculate_null_percentages(df)
-        duplicate_count = df.duplicated().sum()
         duplicate_percentage = (duplicate_count / len(df)) * 100 if len(df) > 0 else 0
         
         report = DataQualityReport(
@@ -181,10 +355,10 @@ class DataQualityAssessor:
             validation_results=validation_results,
             overall_quality_score=quality_score,
             timestamp=datetime.now(),
-            null_percentages=null_percentages,
             duplicate_count=duplicate_count,
             duplicate_percentage=duplicate_percentage,
-            column_profiles=column_profiles
+            null_percentages_factory=make_null_percentages,
+            column_profiles_factory=make_column_profiles
         )
         
         self.logger.info(
@@ -195,15 +369,305 @@ class DataQualityAssessor:
         
         return report
     
-    def _execute_validation_rule(self, df: pd.DataFrame, rule: ValidationRule) -> Optional[ValidationResult]:
+    def assess_data_quality_chunked(
+        self, 
+        reader: Iterable[pd.DataFrame], 
+        dataset_name: str = "unknown",
+        custom_rules: Optional[List[ValidationRule]] = None
+    ) -> DataQualityReport:
+        """Assess a dataset one chunk at a time, e.g. pd.read_csv(..., chunksize=n)
+        
+        Peak memory is one chunk plus one hash per distinct row. Null and
+        duplicate rules are evaluated on counts folded across chunks, row-level
+        rules on each chunk with their counts summed. Column profiles carry
+        null counts and numeric min/max/mean/std only, since medians and
+        distinct counts need the whole column.
+        """
+        
+        self.logger.info(f"Starting chunked data quality assessment for {dataset_name}")
+        
+        rules = self.default_rules.copy()
+        if custom_rules:
+            rules.extend(custom_rules)
+        
+        schema = None
+        total_rows = 0
+        null_counts = None
+        row_hashes = set()
+        numeric_stats: Dict[str, Dict[str, float]] = {}
+        chunk_results: Dict[int, ValidationResult] = {}
+        
+        # Row-level rules are bound once and re-run on every chunk
+        chunk_rule_indices = [
+            i for i, rule in enumerate(rules) if rule.rule_type not in self._FOLDED_RULE_TYPES
+        ]
+        run_chunk_rules = self._compile_rule_runner([rules[i] for i in chunk_rule_indices])
+        
+        for chunk in reader:
+            if schema is None:
+                schema = chunk.iloc[:0]
+                null_counts = pd.Series(0, index=chunk.columns, dtype='int64')
+            
+            total_rows += len(chunk)
+            null_counts += self._count_nulls(chunk)
+            if len(chunk) > 0:
+                row_hashes.update(pd.util.hash_pandas_object(chunk, index=False).to_numpy().tolist())
+            
+            for col, kind in self._dtype_kinds(chunk).items():
+                if kind in _NUMERIC_KINDS:
+                    self._fold_numeric_stats(numeric_stats, col, chunk[col])
+            
+            for i, result in zip(chunk_rule_indices, run_chunk_rules(chunk)):
+                if result:
+                    chunk_results[i] = self._merge_chunk_results(chunk_results.get(i), result)
+        
+        if schema is None:
+            return self.assess_data_quality(pd.DataFrame(), dataset_name, custom_rules)
+        
+        duplicate_count = total_rows - len(row_hashes)
+        
+        validation_results = []
+        for i, rule in enumerate(rules):
+            if rule.rule_type in self._FOLDED_RULE_TYPES:
+                try:
+                    result = self._execute_validation_rule(
+                        schema, rule,
+                        null_counts=null_counts,
+                        duplicate_count=duplicate_count,
+                        total_rows=total_rows
+                    )
+                except Exception as e:
+                    self.logger.error(f"Error executing rule {rule.name}: {e}")
+                    result = None
+            else:
+                result = chunk_results.get(i)
+            if result:
+                validation_results.append(result)
+        
+        quality_score = self._calculate_quality_score(validation_results, schema)
+        
+        null_percentages = {
+            col: float((null_counts[col] / total_rows) * 100) if total_rows > 0 else 0.0
+            for col in schema.columns
+        }
+        
+        column_profiles = {}
+        for col in schema.columns:
+            profile = {
+                'data_type': str(schema[col].dtype),
+                'null_count': int(null_counts[col]),
+                'null_percentage': null_percentages[col],
+            }
+            stats = numeric_stats.get(col)
+            if stats:
+                count = stats['count']
+                profile.update({
+                    'min': stats['min'],
+                    'max': stats['max'],
+                    'mean': stats['mean'],
+                    'std': math.sqrt(stats['M2'] / (count - 1)) if count > 1 else None,
+                })
+            column_profiles[col] = profile
+        
+        duplicate_percentage = (duplicate_count / total_rows) * 100 if total_rows > 0 else 0
+        
+        report = DataQualityReport(
+            dataset_name=dataset_name,
+            total_records=total_rows,
+            total_columns=len(schema.columns),
+            validation_results=validation_results,
+            overall_quality_score=quality_score,
+            timestamp=datetime.now(),
+            duplicate_count=duplicate_count,
+            duplicate_percentage=duplicate_percentage,
+            null_percentages_factory=lambda: null_percentages,
+            column_profiles_factory=lambda: column_profiles
+        )
+        
+        self.logger.info(
+            f"Chunked data quality assessment completed for {dataset_name}",
+            quality_score=quality_score,
+            total_issues=len([r for r in validation_results if not r.passed])
+        )
+        
+        return report
+    
+    # Rules evaluated once on statistics folded across chunks
+    _FOLDED_RULE_TYPES = ("null_percentage", "duplicate_percentage", "data_type")
+    
+    def _fold_numeric_stats(
+        self, 
+        numeric_stats: Dict[str, Dict[str, float]], 
+        column: str, 
+        series: pd.Series
+    ):
+        """Merge one chunk into a column's running count/mean/M2 (Welford, Chan et al.)"""
+        values = series.dropna().to_numpy(dtype='float64')
+        if len(values) == 0:
+            return
+        
+        chunk_count = len(values)
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        
+        stats = numeric_stats.get(column)
+        if stats is None:
+            numeric_stats[column] = {
+                'count': chunk_count,
+                'mean': chunk_mean,
+                'M2': chunk_m2,
+                'min': float(values.min()),
+                'max': float(values.max()),
+            }
+            return
+        
+        count = stats['count'] + chunk_count
+        delta = chunk_mean - stats['mean']
+        stats['mean'] += delta * chunk_count / count
+        stats['M2'] += chunk_m2 + delta ** 2 * stats['count'] * chunk_count / count
+        stats['count'] = count
+        stats['min'] = min(stats['min'], float(values.min()))
+        stats['max'] = max(stats['max'], float(values.max()))
+    
+    def _merge_chunk_results(
+        self, 
+        previous: Optional[ValidationResult], 
+        current: ValidationResult
+    ) -> ValidationResult:
+        """Sum a row-level rule's counts across chunks"""
+        if previous is None:
+            return current
+        
+        failed_count = previous.failed_count + current.failed_count
+        message = current.message
+        count_suffix = f": {current.failed_count}"
+        if message.endswith(count_suffix):
+            message = message[:-len(count_suffix)] + f": {failed_count}"
+        
+        return ValidationResult(
+            rule_name=current.rule_name,
+            column=current.column,
+            passed=previous.passed and current.passed,
+            severity=current.severity,
+            message=message,
+            failed_count=failed_count,
+            total_count=previous.total_count + current.total_count,
+            sample_failed_values=(previous.sample_failed_values + current.sample_failed_values)[:5]
+        )
+    
+    def compile_rules(
+        self, 
+        rules: List[ValidationRule]
+    ) -> Callable[[pd.DataFrame], List[ValidationResult]]:
+        """Bind a fixed rule set once and return a validator to call per frame or chunk
+        
+        Rule dispatch is resolved here instead of on every call, statistics
+        shared by several rules are computed once per frame, and range rules
+        on plain NumPy columns are evaluated together, one pass per dtype.
+        """
+        run = self._compile_rule_runner(rules)
+        
+        def validate(df: pd.DataFrame) -> List[ValidationResult]:
+            return [result for result in run(df) if result]
+        
+        return validate
+    
+    def _compile_rule_runner(
+        self, 
+        rules: List[ValidationRule]
+    ) -> Callable[[pd.DataFrame], List[Optional[ValidationResult]]]:
+        """Validator returning one result (or None) per rule, in rule order"""
+        checks = {
+            "null_percentage": lambda df, rule, shared: self._check_null_percentage(
+                df, rule, null_counts=shared["null_counts"]
+            ),
+            "duplicate_percentage": lambda df, rule, shared: self._check_duplicate_percentage(
+                df, rule, duplicate_count=shared["duplicate_count"]
+            ),
+            "data_type": lambda df, rule, shared: self._check_data_types(
+                df, rule, dtype_kinds=shared["dtype_kinds"]
+            ),
+            "regex": lambda df, rule, shared: self._check_regex_pattern(df, rule),
+            "unique": lambda df, rule, shared: self._check_uniqueness(df, rule),
+            "completeness": lambda df, rule, shared: self._check_completeness(df, rule),
+        }
+        
+        bound = []
+        range_rules = []
+        for i, rule in enumerate(rules):
+            if rule.rule_type == "range":
+                range_rules.append((i, rule))
+            elif rule.rule_type in checks:
+                bound.append((i, rule, checks[rule.rule_type]))
+            else:
+                self.logger.warning(f"Unknown rule type: {rule.rule_type}")
+        
+        rule_types = {rule.rule_type for rule in rules}
+        needs_null_counts = "null_percentage" in rule_types
+        needs_duplicate_count = "duplicate_percentage" in rule_types
+        needs_dtype_kinds = "data_type" in rule_types
+        
+        def run(df: pd.DataFrame) -> List[Optional[ValidationResult]]:
+            shared = {
+                "null_counts": self._count_nulls(df) if needs_null_counts else None,
+                "duplicate_count": self._count_duplicate_rows(df) if needs_duplicate_count else None,
+                "dtype_kinds": self._dtype_kinds(df) if needs_dtype_kinds else None,
+            }
+            results: List[Optional[ValidationResult]] = [None] * len(rules)
+            
+            if range_rules:
+                try:
+                    range_results = self._check_value_ranges(df, [rule for _, rule in range_rules])
+                    for (i, _), result in zip(range_rules, range_results):
+                        results[i] = result
+                except Exception as e:
+                    self.logger.error(f"Error executing range rules: {e}")
+            
+            for i, rule, check in bound:
+                try:
+                    results[i] = check(df, rule, shared)
+                except Exception as e:
+                    self.logger.error(f"Error executing rule {rule.name}: {e}")
+            
+            return results
+        
+        return run
+    
+    # Rule types that target a single named column
+    _COLUMN_RULE_TYPES = ("null_percentage", "range", "regex")
+    
+    def _missing_column_result(self, rule: ValidationRule) -> ValidationResult:
+        """Failed result for a rule whose column is absent from the frame"""
+        suffix = " in dataset" if rule.rule_type == "null_percentage" else ""
+        return ValidationResult(
+            rule_name=rule.name,
+            column=rule.column,
+            passed=False,
+            severity=ValidationSeverity.ERROR,
+            message=f"Column '{rule.column}' not found{suffix}"
+        )
+    
+    def _execute_validation_rule(
+        self, 
+        df: pd.DataFrame, 
+        rule: ValidationRule, 
+        null_counts: Optional[pd.Series] = None,
+        duplicate_count: Optional[int] = None,
+        total_rows: Optional[int] = None,
+        dtype_kinds: Optional[Dict[str, str]] = None
+    ) -> Optional[ValidationResult]:
         """Execute a single validation rule"""
         
         if rule.rule_type == "null_percentage":
-            return self._check_null_percentage(df, rule)
+            return self._check_null_percentage(
+                df, rule, null_counts=null_counts, total_rows=total_rows
+            )
         elif rule.rule_type == "duplicate_percentage":
-            return self._check_duplicate_percentage(df, rule)
+            return self._check_duplicate_percentage(
+                df, rule, duplicate_count=duplicate_count, total_rows=total_rows
+            )
         elif rule.rule_type == "data_type":
-            return self._check_data_types(df, rule)
+            return self._check_data_types(df, rule, dtype_kinds=dtype_kinds)
         elif rule.rule_type == "range":
             return self._check_value_range(df, rule)
         elif rule.rule_type == "regex":
@@ -216,18 +680,27 @@ class DataQualityAssessor:
             self.logger.warning(f"Unknown rule type: {rule.rule_type}")
             return None
     
-    def _check_null_percentage(self, df: pd.DataFrame, rule: ValidationRule) -> ValidationResult:
+    def _check_null_percentage(
+        self, 
+        df: pd.DataFrame, 
+        rule: ValidationRule, 
+        null_counts: Optional[pd.Series] = None,
+        total_rows: Optional[int] = None
+    ) -> ValidationResult:
         """Check null percentage for columns"""
+        if null_counts is None:
+            null_counts = self._count_nulls(df)
+        n_rows = len(df) if total_rows is None else total_rows
+        
         if rule.column == "*":
-            # Check all columns
-            max_null_percentage = 0
-            worst_column = ""
-            
-            for col in df.columns:
-                null_pct = (df[col].isnull().sum() / len(df)) * 100
-                if null_pct > max_null_percentage:
-                    max_null_percentage = null_pct
-                    worst_column = col
+            # Check all columns with a single vectorized reduction
+            null_pcts = (null_counts / n_rows) * 100 if n_rows > 0 else null_counts * 0.0
+            if len(null_pcts) > 0 and null_pcts.max() > 0:
+                worst_column = null_pcts.idxmax()
+                max_null_percentage = float(null_pcts.loc[worst_column])
+            else:
+                max_null_percentage = 0
+                worst_column = ""
             
             max_allowed = rule.parameters.get("max_percentage", 10.0)
             passed = max_null_percentage <= max_allowed
@@ -245,16 +718,10 @@ class DataQualityAssessor:
         else:
             # Check specific column
             if rule.column not in df.columns:
-                return ValidationResult(
-                    rule_name=rule.name,
-                    column=rule.column,
-                    passed=False,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Column '{rule.column}' not found in dataset"
-                )
+                return self._missing_column_result(rule)
             
-            null_count = df[rule.column].isnull().sum()
-            null_percentage = (null_count / len(df)) * 100
+            null_count = null_counts[rule.column]
+            null_percentage = (null_count / n_rows) * 100
             max_allowed = rule.parameters.get("max_percentage", 10.0)
             passed = null_percentage <= max_allowed
             
@@ -265,15 +732,44 @@ class DataQualityAssessor:
                 severity=rule.severity,
                 message=f"Null percentage: {null_percentage:.2f}% (threshold: {max_allowed}%)",
                 failed_count=null_count,
-                total_count=len(df),
+                total_count=n_rows,
                 failed_percentage=null_percentage
             )
     
-    def _check_duplicate_percentage(self, df: pd.DataFrame, rule: ValidationRule) -> ValidationResult:
+    def _count_nulls(self, df: pd.DataFrame) -> pd.Series:
+        """Null count per column, without materializing a full isnull() frame"""
+        return pd.Series(
+            [_fast_null_count(df.iloc[:, i]) for i in range(df.shape[1])],
+            index=df.columns,
+            dtype='int64'
+        )
+    
+    def _count_duplicate_rows(self, df: pd.DataFrame) -> int:
+        """Count duplicate rows from a single row-hashing pass"""
+        if len(df) == 0:
+            return 0
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        return int(len(row_hashes) - len(np.unique(row_hashes)))
+    
+    def _check_duplicate_percentage(
+        self, 
+        df: pd.DataFrame, 
+        rule: ValidationRule, 
+        duplicate_count: Optional[int] = None,
+        total_rows: Optional[int] = None
+    ) -> ValidationResult:
         """Check duplicate record percentage"""
-        duplicate_count = df.duplicated().sum()
-        duplicate_percentage = (duplicate_count / len(df)) * 100 if len(df) > 0 else 0
+        n_rows = len(df) if total_rows is None else total_rows
         max_allowed = rule.parameters.get("max_percentage", 5.0)
+        if duplicate_count is None:
+            duplicated = df.duplicated()
+            if max_allowed == 0 and not duplicated.any():
+                # Zero tolerance only needs to know whether any duplicate exists;
+                # the full count is only taken when the rule is going to fail
+                duplicate_count = 0
+            else:
+                duplicate_count = duplicated.sum()
+        duplicate_percentage = (duplicate_count / n_rows) * 100 if n_rows > 0 else 0
         passed = duplicate_percentage <= max_allowed
         
         return ValidationResult(
@@ -283,26 +779,30 @@ class DataQualityAssessor:
             severity=rule.severity,
             message=f"Duplicate percentage: {duplicate_percentage:.2f}% (threshold: {max_allowed}%)",
             failed_count=duplicate_count,
-            total_count=len(df),
+            total_count=n_rows,
             failed_percentage=duplicate_percentage
         )
     
-    def _check_data_types(self, df: pd.DataFrame, rule: ValidationRule) -> ValidationResult:
+    def _check_data_types(
+        self, 
+        df: pd.DataFrame, 
+        rule: ValidationRule, 
+        dtype_kinds: Optional[Dict[str, str]] = None
+    ) -> ValidationResult:
         """Check data types match expected types"""
         # This is a simplified check - in reality, you'd have expected schema
+        if dtype_kinds is None:
+            dtype_kinds = self._dtype_kinds(df)
         type_issues = []
         
         for col in df.columns:
+            expected = self._expected_types.get(col.lower())
+            if expected is None:
+                continue
+            
             # Basic type validation
-            if col.lower() in ['id', 'user_id']:
-                if not pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_string_dtype(df[col]):
-                    type_issues.append(f"{col} should be numeric or string")
-            elif col.lower() in ['age']:
-                if not pd.api.types.is_numeric_dtype(df[col]):
-                    type_issues.append(f"{col} should be numeric")
-            elif col.lower() in ['date', 'created_at', 'updated_at']:
-                if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                    type_issues.append(f"{col} should be datetime")
+            if dtype_kinds[col] not in _EXPECTED_TYPE_KINDS[expected]:
+                type_issues.append(f"{col} should be {expected.replace('_', ' ')}")
         
         passed = len(type_issues) == 0
         
@@ -321,25 +821,21 @@ class DataQualityAssessor:
         """Check if values are within expected range"""
         column = rule.column
         if column not in df.columns:
-            return ValidationResult(
-                rule_name=rule.name,
-                column=column,
-                passed=False,
-                severity=ValidationSeverity.ERROR,
-                message=f"Column '{column}' not found"
-            )
+            return self._missing_column_result(rule)
         
         min_val = rule.parameters.get("min_value")
         max_val = rule.parameters.get("max_value")
         
-        out_of_range_mask = pd.Series([False] * len(df))
+        # Build the mask directly on the NumPy buffer
+        col_vals = df[column].to_numpy()
         
+        out_of_range_mask = np.zeros(len(df), dtype=bool)
         if min_val is not None:
-            out_of_range_mask |= df[column] < min_val
+            np.less(col_vals, min_val, out=out_of_range_mask)
         if max_val is not None:
-            out_of_range_mask |= df[column] > max_val
+            out_of_range_mask |= col_vals > max_val
         
-        failed_count = out_of_range_mask.sum()
+        failed_count = int(out_of_range_mask.sum())
         passed = failed_count == 0
         
         return ValidationResult(
@@ -350,7 +846,107 @@ class DataQualityAssessor:
             message=f"Values out of range [{min_val}, {max_val}]: {failed_count}",
             failed_count=failed_count,
             total_count=len(df),
-            sample_failed_values=df[column][out_of_range_mask].head(5).tolist()
+            sample_failed_values=col_vals[np.flatnonzero(out_of_range_mask)[:5]].tolist()
+        )
+    
+    def _check_value_ranges(
+        self, 
+        df: pd.DataFrame, 
+        rules: List[ValidationRule]
+    ) -> List[ValidationResult]:
+        """Evaluate several range rules, batching plain NumPy columns of one dtype"""
+        results: List[Optional[ValidationResult]] = [None] * len(rules)
+        
+        groups: Dict[np.dtype, List[int]] = {}
+        for j, rule in enumerate(rules):
+            column = rule.column
+            dtype = df[column].dtype if column in df.columns else None
+            if isinstance(dtype, np.dtype) and self._batchable_range(dtype, rule):
+                groups.setdefault(dtype, []).append(j)
+            else:
+                results[j] = self._check_value_range(df, rules[j])
+        
+        for dtype, indices in groups.items():
+            group_rules = [rules[j] for j in indices]
+            values = df[[rule.column for rule in group_rules]].to_numpy()
+            # Integer blocks compare against bounds of their own dtype, so
+            # values past 2**53 are not rounded through float64
+            if dtype.kind == 'f':
+                bound_dtype, lowest, highest = np.float64, -np.inf, np.inf
+            else:
+                info = np.iinfo(dtype)
+                bound_dtype, lowest, highest = dtype, info.min, info.max
+            lows = np.array([
+                lowest if rule.parameters.get("min_value") is None else rule.parameters["min_value"]
+                for rule in group_rules
+            ], dtype=bound_dtype)
+            highs = np.array([
+                highest if rule.parameters.get("max_value") is None else rule.parameters["max_value"]
+                for rule in group_rules
+            ], dtype=bound_dtype)
+            
+            # One comparison over the whole block; a column per rule
+            out_of_range = (values < lows) | (values > highs)
+            failed_counts = out_of_range.sum(axis=0)
+            
+            for k, (j, rule) in enumerate(zip(indices, group_rules)):
+                min_val = rule.parameters.get("min_value")
+                max_val = rule.parameters.get("max_value")
+                failed_count = int(failed_counts[k])
+                results[j] = ValidationResult(
+                    rule_name=rule.name,
+                    column=rule.column,
+                    passed=failed_count == 0,
+                    severity=rule.severity,
+                    message=f"Values out of range [{min_val}, {max_val}]: {failed_count}",
+                    failed_count=failed_count,
+                    total_count=len(df),
+                    sample_failed_values=values[np.flatnonzero(out_of_range[:, k])[:5], k].tolist()
+                )
+        
+        return results
+    
+    @staticmethod
+    def _batchable_range(dtype: np.dtype, rule: ValidationRule) -> bool:
+        """Whether a range rule on a plain NumPy column can join a dtype block"""
+        if dtype.kind == 'f':
+            return True
+        if dtype.kind not in 'iu':
+            return False
+        # Integer blocks need bounds the column's dtype holds exactly
+        info = np.iinfo(dtype)
+        return all(
+            bound is None
+            or (isinstance(bound, (int, np.integer)) and not isinstance(bound, bool)
+                and info.min <= bound <= info.max)
+            for bound in (rule.parameters.get("min_value"), rule.parameters.get("max_value"))
+        )
+    
+    def _check_regex_pattern(self, df: pd.DataFrame, rule: ValidationRule) -> ValidationResult:
+        """Check if non-null values match a regular expression"""
+        column = rule.column
+        if column not in df.columns:
+            return self._missing_column_result(rule)
+        
+        # Compile each pattern once; pandas reuses a compiled pattern as-is
+        pattern = rule.parameters["pattern"]
+        compiled = self._regex_cache.get(pattern)
+        if compiled is None:
+            compiled = self._regex_cache[pattern] = re.compile(pattern)
+        
+        values = df[column].dropna().astype(str)
+        failed_mask = ~values.str.contains(compiled, na=False, regex=True).to_numpy()
+        failed_count = int(failed_mask.sum())
+        
+        return ValidationResult(
+            rule_name=rule.name,
+            column=column,
+            passed=failed_count == 0,
+            severity=rule.severity,
+            message=f"Values not matching pattern '{pattern}': {failed_count}",
+            failed_count=failed_count,
+            total_count=len(df),
+            sample_failed_values=values.iloc[np.flatnonzero(failed_mask)[:5]].tolist()
         )
     
     def _calculate_quality_score(self, results: List[ValidationResult], df: pd.DataFrame) -> float:
@@ -358,25 +954,17 @@ class DataQualityAssessor:
         if not results:
             return 100.0
         
-        # Weight by severity
-        severity_weights = {
-            ValidationSeverity.INFO: 0.1,
-            ValidationSeverity.WARNING: 0.3,
-            ValidationSeverity.ERROR: 0.7,
-            ValidationSeverity.CRITICAL: 1.0
-        }
+        # Weight by severity, gathered from a flat array in one step
+        count = len(results)
+        severity = np.fromiter((_SEVERITY_INDEX[r.severity] for r in results), dtype=np.int8, count=count)
+        failed_pct = np.fromiter((r.failed_percentage for r in results), dtype=np.float64, count=count)
+        passed = np.fromiter((r.passed for r in results), dtype=bool, count=count)
         
-        total_weight = 0
-        penalty_score = 0
+        weights = self._severity_weight_arr[severity]
+        total_weight = float(weights.sum())
         
-        for result in results:
-            weight = severity_weights[result.severity]
-            total_weight += weight
-            
-            if not result.passed:
-                # Penalty based on failed percentage and severity
-                penalty = (result.failed_percentage / 100.0) * weight
-                penalty_score += penalty
+        # Penalty based on failed percentage and severity
+        penalty_score = float(np.where(passed, 0.0, failed_pct / 100.0 * weights).sum())
         
         if total_weight == 0:
             return 100.0
@@ -385,37 +973,116 @@ class DataQualityAssessor:
         quality_score = max(0, 100 - (penalty_score / total_weight) * 100)
         return round(quality_score, 2)
     
-    def _generate_column_profiles(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    def _dtype_kinds(self, df: pd.DataFrame) -> Dict[str, str]:
+        """dtype.kind per column; categoricals are left out of the string kinds"""
+        return {
+            col: '' if isinstance(dtype, pd.CategoricalDtype) else dtype.kind
+            for col, dtype in df.dtypes.items()
+        }
+    
+    def _to_categorical_view(
+        self, 
+        df: pd.DataFrame, 
+        max_unique_ratio: float = 0.5,
+        dtype_kinds: Optional[Dict[str, str]] = None
+    ) -> pd.DataFrame:
+        """Shallow copy of df with low-cardinality string columns as categoricals"""
+        view = df.copy(deep=False)
+        n = len(df)
+        if n == 0:
+            return view
+        if dtype_kinds is None:
+            dtype_kinds = self._dtype_kinds(df)
+        
+        for col in df.columns:
+            if dtype_kinds[col] in _STRING_KINDS:
+                if df[col].nunique(dropna=True) / n < max_unique_ratio:
+                    view[col] = df[col].astype('category')
+        
+        return view
+    
+    def _generate_column_profiles(
+        self, 
+        df: pd.DataFrame, 
+        categorical_view: Optional[pd.DataFrame] = None,
+        null_counts: Optional[pd.Series] = None,
+        dtype_kinds: Optional[Dict[str, str]] = None,
+        approximate: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
         """Generate detailed profiles for each column"""
         profiles = {}
+        n = len(df)
+        # Dtypes are reported from df; counting runs on the categorical view
+        view = categorical_view if categorical_view is not None else df
+        
+        # Frame-wide reductions, each a single pass over the data
+        if null_counts is None:
+            null_counts = self._count_nulls(df)
+        if dtype_kinds is None:
+            dtype_kinds = self._dtype_kinds(df)
+        if approximate and n > _APPROXIMATE_PROFILE_MIN_ROWS:
+            # Hashing wins over nunique's hash table for fixed-width values;
+            # object/string columns keep the exact count
+            estimated_cols = [
+                col for col in df.columns if dtype_kinds[col] in _FIXED_WIDTH_KINDS
+            ]
+            exact_cols = [col for col in df.columns if dtype_kinds[col] not in _FIXED_WIDTH_KINDS]
+            unique_counts = pd.concat([
+                view[exact_cols].nunique(dropna=True),
+                pd.Series({col: _approximate_distinct_count(df[col]) for col in estimated_cols}, dtype='int64')
+            ])
+        else:
+            unique_counts = view.nunique(dropna=True)
+        numeric_cols = [col for col in df.columns if dtype_kinds[col] in _NUMERIC_KINDS]
+        numeric_stats = None
+        narrowed_dtypes: Dict[str, str] = {}
+        if numeric_cols and n > 0:
+            numeric_frame = df[numeric_cols]
+            extremes = numeric_frame.agg(['min', 'max'])
+            numeric_frame, narrowed_dtypes = self._narrow_integer_columns(numeric_frame, extremes)
+            numeric_stats = pd.concat([extremes, numeric_frame.agg(['mean', 'median', 'std'])])
         
         for col in df.columns:
+            null_count = int(null_counts[col])
+            unique_count = int(unique_counts[col])
             profile = {
                 'data_type': str(df[col].dtype),
-                'null_count': int(df[col].isnull().sum()),
-                'null_percentage': float((df[col].isnull().sum() / len(df)) * 100),
-                'unique_count': int(df[col].nunique()),
-                'unique_percentage': float((df[col].nunique() / len(df)) * 100),
+                'null_count': null_count,
+                'null_percentage': float((null_count / n) * 100) if n else 0.0,
+                'unique_count': unique_count,
+                'unique_percentage': float((unique_count / n) * 100) if n else 0.0,
             }
             
             # Numeric columns
-            if pd.api.types.is_numeric_dtype(df[col]):
+            if numeric_stats is not None and col in numeric_stats.columns:
+                stats = numeric_stats[col]
                 profile.update({
-                    'min': float(df[col].min()) if not df[col].empty else None,
-                    'max': float(df[col].max()) if not df[col].empty else None,
-                    'mean': float(df[col].mean()) if not df[col].empty else None,
-                    'median': float(df[col].median()) if not df[col].empty else None,
-                    'std': float(df[col].std()) if not df[col].empty else None,
+                    'min': float(stats['min']),
+                    'max': float(stats['max']),
+                    'mean': float(stats['mean']),
+                    'median': float(stats['median']),
+                    'std': float(stats['std']),
                 })
+                if col in narrowed_dtypes:
+                    profile['profiled_dtype'] = narrowed_dtypes[col]
+            elif col in numeric_cols:
+                profile.update({'min': None, 'max': None, 'mean': None, 'median': None, 'std': None})
             
             # String columns
-            elif pd.api.types.is_string_dtype(df[col]) or pd.api.types.is_object_dtype(df[col]):
-                non_null_values = df[col].dropna()
+            elif dtype_kinds[col] in _STRING_KINDS:
+                non_null_values = view[col].dropna()
                 if not non_null_values.empty:
+                    # Measure string lengths once; for categoricals only the
+                    # categories are measured and then gathered by code
+                    if isinstance(non_null_values.dtype, pd.CategoricalDtype):
+                        category_lengths = non_null_values.cat.categories.astype(str).str.len().to_numpy()
+                        lengths = category_lengths[non_null_values.cat.codes.to_numpy()]
+                    else:
+                        lengths = non_null_values.astype(str).str.len().to_numpy()
                     profile.update({
-                        'avg_length': float(non_null_values.astype(str).str.len().mean()),
-                        'min_length': int(non_null_values.astype(str).str.len().min()),
-                        'max_length': int(non_null_values.astype(str).str.len().max()),
+                        'avg_length': float(lengths.mean()),
+                        'min_length': int(lengths.min()),
+                        'max_length': int(lengths.max()),
                         'top_values': non_null_values.value_counts().head(5).to_dict()
                     })
             
@@ -423,10 +1090,53 @@ class DataQualityAssessor:
         
         return profiles
     
-    def _calculate_null_percentages(self, df: pd.DataFrame) -> Dict[str, float]:
+    def _narrow_integer_columns(
+        self, 
+        numeric_frame: pd.DataFrame, 
+        extremes: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """Copy integer columns into the smallest dtype holding their min/max
+        
+        Only plain NumPy integers are narrowed, which keeps mean/median/std
+        exact; floats would lose precision as float32 and are left alone.
+        Returns the frame for the remaining reductions and the dtypes used.
+        """
+        narrowed = {}
+        narrowed_dtypes = {}
+        for col in numeric_frame.columns:
+            dtype = numeric_frame[col].dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in 'iu':
+                continue
+            # Extremes come back as floats when the frame mixes dtypes
+            target = np.result_type(
+                np.min_scalar_type(int(extremes.at['min', col])),
+                np.min_scalar_type(int(extremes.at['max', col]))
+            )
+            if target.kind in 'iu' and target.itemsize < dtype.itemsize:
+                narrowed[col] = numeric_frame[col].to_numpy().astype(target)
+                narrowed_dtypes[col] = str(target)
+        
+        if not narrowed:
+            return numeric_frame, narrowed_dtypes
+        # Shallow copy so replacing columns never reaches the caller's frame
+        numeric_frame = numeric_frame.copy(deep=False)
+        for col, values in narrowed.items():
+            numeric_frame[col] = values
+        return numeric_frame, narrowed_dtypes
+    
+    def _calculate_null_percentages(
+        self, 
+        df: pd.DataFrame, 
+        null_counts: Optional[pd.Series] = None
+    ) -> Dict[str, float]:
         """Calculate null percentages for all columns"""
+        n = len(df)
+        if n == 0:
+            return {col: 0.0 for col in df.columns}
+        if null_counts is None:
+            null_counts = self._count_nulls(df)
         return {
-            col: float((df[col].isnull().sum() / len(df)) * 100)
+            col: float((null_counts[col] / n) * 100)
             for col in df.columns
         }
     
@@ -1,8 +1,117 @@
 import csv
 import json
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+# pandas' default NA strings, so Arrow-parsed frames null the same fields
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+
+# Identifier columns parsed as text by the Arrow reader, so long numeric ids
+# are never rounded through a float
+_CSV_STRING_COLUMNS = {'user_id': pa.string()} if pa is not None else {}
+
+# Floats at or beyond this magnitude may be integers Arrow could not fit in int64
+_INT64_LIMIT = 2 ** 63
+
+
+def _read_csv_arrow(file_path):
+    """
+    Parse a CSV with pyarrow's multithreaded reader into a pandas frame
+    
+    Values come out as pandas.read_csv would give them: timestamps and
+    times are not inferred and ISO dates stay strings, so downstream parsing
+    is unchanged. Identifier columns are read as text. Returns None for
+    files Arrow cannot read the same way (repeated headers, which pandas
+    renames, and integers wider than int64, which Arrow turns into lossy
+    floats) so the caller falls back to pandas.
+    """
+    read_options = pacsv.ReadOptions(block_size=8 << 20, use_threads=True)
+    column_types = dict(_CSV_STRING_COLUMNS)
+    
+    def read(column_types):
+        return pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                null_values=PANDAS_NA_VALUES,
+                strings_can_be_null=True,
+                # A parser no field can match turns timestamp inference off
+                timestamp_parsers=['\x00']
+            )
+        )
+    
+    table = read(column_types)
+    if len(set(table.column_names)) != table.num_columns:
+        return None
+    
+    # Arrow has no switch for time inference; re-read HH:MM[:SS] columns as text
+    time_columns = {field.name: pa.string() for field in table.schema if pa.types.is_time(field.type)}
+    if time_columns:
+        table = read({**column_types, **time_columns})
+    
+    for i, column_type in enumerate(table.schema.types):
+        if pa.types.is_floating(column_type):
+            # Integers past int64 are inferred as double; pandas keeps them exact
+            bounds = pc.min_max(table.column(i))
+            if any(bound.is_valid and abs(bound.as_py()) >= _INT64_LIMIT
+                   for bound in (bounds['min'], bounds['max'])):
+                return None
+        elif pa.types.is_date(column_type):
+            # date32 is only inferred from strict YYYY-MM-DD text, which the
+            # cast reproduces exactly
+            table = table.set_column(i, table.field(i).name, pc.cast(table.column(i), pa.string()))
+    
+    df = table.to_pandas()
+    # Booleans with nulls convert to objects holding None; pandas fills NaN
+    for field in table.schema:
+        if pa.types.is_boolean(field.type) and table.column(field.name).null_count:
+            df[field.name] = df[field.name].where(df[field.name].notna(), np.nan)
+    return df
+
+
+def _read_csv(file_path):
+    print(f"Extracting CSV data from {file_path}")
+    if pa is not None:
+        try:
+            df = _read_csv_arrow(file_path)
+            if df is not None:
+                return df
+        except pa.ArrowInvalid:
+            # Let pandas parse (and report on) files Arrow rejects
+            pass
+    return pd.read_csv(file_path)
+
+
+def _read_json(file_path):
+    print(f"Extracting JSON data from {file_path}")
+    return pd.read_json(file_path)
+
+
+def _read_parquet(file_path):
+    print(f"Extracting Parquet data from {file_path}")
+    return pd.read_parquet(file_path)
+
+
+# Reader per lowercased file extension; register new formats here
+_EXTRACTORS = {
+    '.csv': _read_csv,
+    '.json': _read_json,
+    '.parquet': _read_parquet,
+}
+
 
 def extract_data(file_path):
     file_path = Path(file_path)
@@ -13,19 +122,14 @@ def extract_data(file_path):
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # ✅ Handle CSV
-        if file_type == ".csv":
-            print(f"Extracting CSV data from {file_path}")
-            df = pd.read_csv(file_path)
-        
-        # ✅ Handle JSON
-        elif file_type == ".json":
-            print(f"Extracting JSON data from {file_path}")
-            df = pd.read_json(file_path)
+        # ✅ Dispatch on extension, case-insensitively (.CSV, .Json, ...)
+        reader = _EXTRACTORS.get(file_type.lower())
         
         # ❌ Unsupported file type
-        else:
+        if reader is None:
             raise ValueError(f"Unsupported file type: {file_type}")
+        
+        df = reader(file_path)
 
         # ✅ Show a preview
         print(df.head())
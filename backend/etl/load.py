@@ -1,10 +1,24 @@
+import io
+import numpy as np
 import pandas as pd
 import psycopg2
 from sqlalchemy import create_engine, text
 import logging
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -12,6 +26,60 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# user_id column dtype for the staging frame
+_USER_ID_DTYPE = 'string[pyarrow]' if pa is not None else object
+
+# SQL statements, built once at import instead of per call
+_SELECT_ONE = text("SELECT 1")
+
+_CREATE_USERS = text("""
+CREATE TABLE IF NOT EXISTS users (
+    user_id VARCHAR(50) PRIMARY KEY,
+    age INTEGER NOT NULL,
+    sign_up_date DATE NOT NULL,
+    is_active BOOLEAN NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+""")
+
+_CREATE_USERS_STAGING = text("""
+CREATE TEMP TABLE users_staging (
+    row_order BIGINT,
+    user_id VARCHAR(50),
+    age INTEGER,
+    sign_up_date DATE,
+    is_active BOOLEAN
+) ON COMMIT DROP;
+""")
+
+_COPY_USERS_STAGING = (
+    "COPY users_staging (row_order, user_id, age, sign_up_date, is_active) "
+    "FROM STDIN WITH (FORMAT CSV)"
+)
+
+# Use PostgreSQL's ON CONFLICT DO UPDATE for upsert; the last row per
+# user_id wins, as it did when rows were upserted one by one
+_UPSERT_FROM_STAGING = text("""
+INSERT INTO users (user_id, age, sign_up_date, is_active, updated_at)
+SELECT DISTINCT ON (user_id) user_id, age, sign_up_date, is_active, CURRENT_TIMESTAMP
+FROM users_staging
+ORDER BY user_id, row_order DESC
+ON CONFLICT (user_id) 
+DO UPDATE SET 
+    age = EXCLUDED.age,
+    sign_up_date = EXCLUDED.sign_up_date,
+    is_active = EXCLUDED.is_active,
+    updated_at = CURRENT_TIMESTAMP;
+""")
+
+# Row count and a 3-row sample in one round trip; the server builds the sample as JSON
+_VERIFY_USERS = text("""
+SELECT COUNT(*) AS row_count,
+       (SELECT json_agg(t) FROM (SELECT * FROM users LIMIT 3) t) AS sample
+FROM users
+""")
+
 
 def get_db_config():
     """
@@ -41,6 +109,24 @@ def get_db_config():
     }
 
 
+@lru_cache(maxsize=4)
+def _get_engine(connection_string):
+    """
+    Build (once per connection string) a pooled SQLAlchemy engine
+    
+    Engines are shared across calls so repeated loads and verifications
+    check out pooled connections instead of opening a new one each time.
+    """
+    return create_engine(
+        connection_string,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        executemany_mode='values_plus_batch'
+    )
+
+
 def connect_to_postgres(db_config=None):
     """
     Create connection to PostgreSQL database with retry logic
@@ -68,18 +154,20 @@ def connect_to_postgres(db_config=None):
         # Create connection string
         connection_string = f"postgresql://{db_config['user']}:{db_config['password']}@{db_config['host']}:{db_config['port']}/{db_config['database']}"
         
-        # Create SQLAlchemy engine
-        engine = create_engine(connection_string)
+        # Reuse the pooled SQLAlchemy engine for this connection string
+        engine = _get_engine(connection_string)
         
         # Test connection
         with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            logger.info(f"Successfully connected to PostgreSQL database: {db_config['database']}")
+            conn.execute(_SELECT_ONE)
+            logger.info("Successfully connected to PostgreSQL database: %s", db_config['database'])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Connection pool status: %s", engine.pool.status())
             
         return engine
         
     except Exception as e:
-        logger.error(f"Failed to connect to PostgreSQL: {str(e)}")
+        logger.error("Failed to connect to PostgreSQL: %s", e)
         raise ConnectionError(f"Database connection failed: {str(e)}")
 
 
@@ -97,31 +185,62 @@ def ensure_users_table_exists(engine):
     bool
         True if table exists or was created successfully
     """
-    create_table_sql = """
-    CREATE TABLE IF NOT EXISTS users (
-        user_id VARCHAR(50) PRIMARY KEY,
-        age INTEGER NOT NULL,
-        sign_up_date DATE NOT NULL,
-        is_active BOOLEAN NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    """
-    
     try:
         with engine.connect() as conn:
             # Create table
-            conn.execute(text(create_table_sql))
+            conn.execute(_CREATE_USERS)
             conn.commit()
             logger.info("Users table verified/created successfully")
             return True
             
     except Exception as e:
-        logger.error(f"Failed to create users table: {str(e)}")
+        logger.error("Failed to create users table: %s", e)
         raise
 
 
-def load_data(dataframe, db_config=None):
+def _to_staging_frame(dataframe):
+    """
+    Coerce the load columns the way the per-row upsert did, ready for COPY
+    
+    Missing ages and dates become empty fields (NULL in COPY CSV); a missing
+    is_active becomes False. Columns are narrowed to the table's types:
+    age to Int32 (INTEGER) and user_id to Arrow-backed strings, so the
+    payload writer reads contiguous buffers instead of Python objects.
+    """
+    ages = np.trunc(pd.to_numeric(dataframe['age']).astype('float64'))
+    user_ids = dataframe['user_id'].map(str)
+    return pd.DataFrame({
+        'row_order': np.arange(len(dataframe)),
+        'user_id': user_ids.astype(_USER_ID_DTYPE).array,
+        'age': pd.array(ages.to_numpy(), dtype='Int32'),
+        'sign_up_date': dataframe['sign_up_date'].to_numpy(),
+        'is_active': dataframe['is_active'].fillna(False).astype(bool).to_numpy()
+    })
+
+
+def _to_copy_payload(staged):
+    """
+    Serialize the staging frame as headerless CSV for COPY
+    
+    Uses pyarrow's vectorized CSV writer when available; frames Arrow
+    cannot convert go through pandas' row formatter instead.
+    """
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(staged, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=False))
+            return io.BytesIO(sink.getvalue().to_pybytes())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.debug("Falling back to pandas CSV for COPY payload: %s", e)
+    
+    buffer = io.StringIO()
+    staged.to_csv(buffer, index=False, header=False, date_format='%Y-%m-%d')
+    buffer.seek(0)
+    return buffer
+
+
+def load_data(dataframe, db_config=None, engine=None):
     """
     Load clean user data into PostgreSQL using APPEND strategy
     
@@ -132,6 +251,8 @@ def load_data(dataframe, db_config=None):
     db_config : dict, optional
         Database configuration with keys: host, port, database, user, password
         If None, loads from environment variables
+    engine : sqlalchemy.engine.Engine, optional
+        Already-connected engine to load through; db_config is then unused
         
     Returns:
     --------
@@ -145,40 +266,36 @@ def load_data(dataframe, db_config=None):
     if missing_cols:
         raise ValueError(f"DataFrame missing required columns: {missing_cols}")
     
-    logger.info(f"Starting data load for {len(dataframe)} rows")
+    logger.info("Starting data load for %s rows", len(dataframe))
     
     try:
-        # Step 1: Connect to database
-        engine = connect_to_postgres(db_config)
+        # Step 1: Connect to database, unless the caller holds an engine
+        if engine is None:
+            engine = connect_to_postgres(db_config)
         
-        # Step 2: Ensure table exists
-        ensure_users_table_exists(engine)
+        # Step 2: Load data using UPSERT strategy (COPY into staging, then INSERT ON CONFLICT)
+        buffer = _to_copy_payload(_to_staging_frame(dataframe))
         
-        # Step 3: Load data using UPSERT strategy (INSERT ON CONFLICT)
         with engine.begin() as connection:
-            # Use PostgreSQL's ON CONFLICT DO UPDATE for upsert
-            for _, row in dataframe.iterrows():
-                upsert_sql = """
-                INSERT INTO users (user_id, age, sign_up_date, is_active, updated_at)
-                VALUES (:user_id, :age, :sign_up_date, :is_active, CURRENT_TIMESTAMP)
-                ON CONFLICT (user_id) 
-                DO UPDATE SET 
-                    age = EXCLUDED.age,
-                    sign_up_date = EXCLUDED.sign_up_date,
-                    is_active = EXCLUDED.is_active,
-                    updated_at = CURRENT_TIMESTAMP;
-                """
-                
-                connection.execute(text(upsert_sql), {
-                    'user_id': str(row['user_id']),
-                    'age': int(row['age']) if pd.notna(row['age']) else None,
-                    'sign_up_date': row['sign_up_date'] if pd.notna(row['sign_up_date']) else None,
-                    'is_active': bool(row['is_active']) if pd.notna(row['is_active']) else False
-                })
+            # Ensure the table exists in the load's own transaction rather than
+            # a separate connection and commit per call (per chunk when streaming)
+            connection.execute(_CREATE_USERS)
+            
+            # COPY streams every row in one statement, bypassing per-row parsing
+            # and planning; the staging table is dropped at commit
+            connection.execute(_CREATE_USERS_STAGING)
+            
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(_COPY_USERS_STAGING, buffer)
+            finally:
+                cursor.close()
+            
+            connection.execute(_UPSERT_FROM_STAGING)
         
-        logger.info(f"Successfully loaded {len(dataframe)} rows into users table")
+        logger.info("Successfully loaded %s rows into users table", len(dataframe))
         
-        # Step 4: Return success result
+        # Step 3: Return success result
         return {
             'success': True,
             'rows_loaded': len(dataframe),
@@ -186,7 +303,86 @@ def load_data(dataframe, db_config=None):
         }
         
     except Exception as e:
-        logger.error(f"Data load failed: {str(e)}")
+        logger.error("Data load failed: %s", e)
+        return {
+            'success': False,
+            'rows_loaded': 0,
+            'message': f'Load failed: {str(e)}'
+        }
+
+
+def _to_copy_records(staged):
+    """
+    Convert the staging frame to tuples of Python values for asyncpg's COPY
+    
+    asyncpg encodes each value by column type, so dates must be date
+    objects and missing values None rather than NA/NaT.
+    """
+    dates = pd.to_datetime(staged['sign_up_date'])
+    return list(zip(
+        staged['row_order'].tolist(),
+        staged['user_id'].tolist(),
+        staged['age'].to_numpy(dtype=object, na_value=None).tolist(),
+        dates.dt.date.astype(object).where(dates.notna(), None).tolist(),
+        staged['is_active'].tolist()
+    ))
+
+
+async def load_data_async(dataframe, pool):
+    """
+    Load clean user data into PostgreSQL over an asyncpg connection pool
+    
+    Same UPSERT semantics as load_data, but the COPY into the staging table
+    runs on an async connection, so several loads can share one event loop:
+    ``await asyncio.gather(*(load_data_async(df, pool) for df in chunks))``.
+    The users table must already exist (see ensure_users_table_exists).
+    
+    Parameters:
+    -----------
+    dataframe : pandas.DataFrame
+        Clean DataFrame with columns: user_id, age, sign_up_date, is_active
+    pool : asyncpg.Pool
+        Connection pool to the target database
+        
+    Returns:
+    --------
+    dict
+        Load results with success status and row count
+    """
+    if asyncpg is None:
+        raise ImportError("asyncpg is required for load_data_async")
+    
+    # Validate input DataFrame
+    required_columns = ['user_id', 'age', 'sign_up_date', 'is_active']
+    missing_cols = [col for col in required_columns if col not in dataframe.columns]
+    if missing_cols:
+        raise ValueError(f"DataFrame missing required columns: {missing_cols}")
+    
+    logger.info("Starting async data load for %s rows", len(dataframe))
+    
+    try:
+        records = _to_copy_records(_to_staging_frame(dataframe))
+        
+        async with pool.acquire() as connection:
+            async with connection.transaction():
+                await connection.execute(_CREATE_USERS_STAGING.text)
+                await connection.copy_records_to_table(
+                    'users_staging',
+                    records=records,
+                    columns=['row_order', 'user_id', 'age', 'sign_up_date', 'is_active']
+                )
+                await connection.execute(_UPSERT_FROM_STAGING.text)
+        
+        logger.info("Successfully loaded %s rows into users table", len(dataframe))
+        
+        return {
+            'success': True,
+            'rows_loaded': len(dataframe),
+            'message': f'Successfully loaded {len(dataframe)} rows'
+        }
+        
+    except Exception as e:
+        logger.error("Async data load failed: %s", e)
         return {
             'success': False,
             'rows_loaded': 0,
@@ -212,31 +408,28 @@ def verify_load_success(engine, expected_rows):
     """
     try:
         with engine.connect() as conn:
-            # Count total rows
-            count_result = conn.execute(text("SELECT COUNT(*) FROM users"))
-            actual_rows = count_result.fetchone()[0]
-            
-            # Get sample data
-            sample_result = conn.execute(text("SELECT * FROM users LIMIT 3"))
-            sample_data = sample_result.fetchall()
+            # Count total rows and get sample data
+            row = conn.execute(_VERIFY_USERS).one()
+            actual_rows = row.row_count
+            sample_data = row.sample or []
             
             # Verify row count matches
             success = actual_rows == expected_rows
             
             if success:
-                logger.info(f"Load verification successful: {actual_rows} rows loaded")
+                logger.info("Load verification successful: %s rows loaded", actual_rows)
             else:
-                logger.warning(f"Row count mismatch: expected {expected_rows}, found {actual_rows}")
+                logger.warning("Row count mismatch: expected %s, found %s", expected_rows, actual_rows)
             
             return {
                 'success': success,
                 'expected_rows': expected_rows,
                 'actual_rows': actual_rows,
-                'sample_data': [dict(row) for row in sample_data]
+                'sample_data': sample_data
             }
             
     except Exception as e:
-        logger.error(f"Load verification failed: {str(e)}")
+        logger.error("Load verification failed: %s", e)
         return {
             'success': False,
             'error': str(e)
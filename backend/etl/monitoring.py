@@ -6,21 +6,131 @@ Provides comprehensive monitoring, metrics collection, and alerting
 for production ETL pipelines.
 """
 
+import os
 import json
+import math
 import time
+import queue
+import atexit
 import smtplib
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Iterator
+from dataclasses import dataclass, field
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _BackgroundWriter:
+    """
+    Daemon thread that performs queued file writes off the caller's thread
+    
+    write() only enqueues; flush() waits for everything queued so far and
+    close() drains the queue and stops the thread (also run at exit). Each
+    wake-up drains the queue and appends to a file with a single write.
+    """
+    
+    _STOP = object()
+    # Most queued items written per wake-up of the writer thread
+    _MAX_BATCH = 256
+    
+    def __init__(self, name: str):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def write(self, path: Path, data: bytes, mode: str = 'ab'):
+        """Queue data to be written to path ('ab' appends, 'wb' replaces)"""
+        if self._closed:
+            self._write(path, data, mode)
+        else:
+            self._queue.put((path, data, mode))
+    
+    def flush(self):
+        """Block until every queued write has been performed"""
+        self._queue.join()
+    
+    def close(self):
+        """Perform the remaining writes and stop the writer thread"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(self._STOP)
+            self._thread.join()
+    
+    @staticmethod
+    def _write(path: Path, data: bytes, mode: str):
+        try:
+            with open(path, mode) as f:
+                f.write(data)
+        except Exception as e:
+            logger.error("Failed to write %s: %s", path, e)
+    
+    def _write_batch(self, batch: List[Any]) -> bool:
+        """Write a batch, joining appends to the same file; True on stop"""
+        stop = False
+        appends: Dict[Path, List[bytes]] = {}
+        for item in batch:
+            if item is self._STOP:
+                stop = True
+                continue
+            path, data, mode = item
+            if mode == 'ab':
+                appends.setdefault(path, []).append(data)
+            else:
+                # Earlier appends to this file must land before it is replaced
+                pending = appends.pop(path, None)
+                if pending:
+                    self._write(path, b"".join(pending), 'ab')
+                self._write(path, data, mode)
+        for path, chunks in appends.items():
+            self._write(path, b"".join(chunks), 'ab')
+        return stop
+    
+    def _run(self):
+        while True:
+            # Block for one item, then take whatever else is already queued
+            batch = [self._queue.get()]
+            while len(batch) < self._MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                stop = self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+
+@dataclass(slots=True)
 class PipelineMetrics:
     """Data class for pipeline execution metrics"""
     pipeline_id: str
@@ -34,15 +144,69 @@ class PipelineMetrics:
     execution_time_seconds: float = 0.0
     data_quality_score: float = 100.0
     memory_usage_mb: float = 0.0
+    # time.monotonic_ns() at start, for clock-jump-proof execution times
+    _start_monotonic: int = field(default=0, repr=False, compare=False)
+    # time.monotonic_ns() of the last progress log line for this run
+    _last_progress_log: int = field(default=0, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        result = asdict(self)
-        # Convert datetime objects to ISO strings
-        if self.start_time:
-            result['start_time'] = self.start_time.isoformat()
-        if self.end_time:
-            result['end_time'] = self.end_time.isoformat()
-        return result
+        # Built field by field: asdict() would deep-copy every value only for
+        # the timestamps to be overwritten with ISO strings
+        return {
+            'pipeline_id': self.pipeline_id,
+            'start_time': self.start_time.isoformat() if self.start_time else self.start_time,
+            'end_time': self.end_time.isoformat() if self.end_time else self.end_time,
+            'status': self.status,
+            'stage': self.stage,
+            'file_path': self.file_path,
+            'rows_processed': self.rows_processed,
+            'error_message': self.error_message,
+            'execution_time_seconds': self.execution_time_seconds,
+            'data_quality_score': self.data_quality_score,
+            'memory_usage_mb': self.memory_usage_mb
+        }
+
+
+# Fixed-schema JSON template for PipelineMetrics, in to_dict() key order
+_METRICS_TEMPLATE = (
+    '{"pipeline_id":%s,"start_time":%s,"end_time":%s,"status":%s,"stage":%s,'
+    '"file_path":%s,"rows_processed":%d,"error_message":%s,'
+    '"execution_time_seconds":%r,"data_quality_score":%r,"memory_usage_mb":%r}'
+)
+_encode_str = json.encoder.encode_basestring_ascii
+
+
+def _encode_metrics(metrics: PipelineMetrics) -> bytes:
+    """
+    Serialize PipelineMetrics to JSON equivalent to _dumps(to_dict())
+    
+    orjson is fastest when installed; otherwise the known schema is filled
+    into a template, skipping the dict build and json's type dispatch.
+    """
+    if orjson is not None or type(metrics) is not PipelineMetrics:
+        return _dumps(metrics.to_dict())
+    
+    execution_time = float(metrics.execution_time_seconds)
+    quality_score = float(metrics.data_quality_score)
+    memory_usage = float(metrics.memory_usage_mb)
+    if not math.isfinite(execution_time + quality_score + memory_usage):
+        # repr would write nan/inf, which json spells NaN/Infinity
+        return _dumps(metrics.to_dict())
+    
+    start_time, end_time = metrics.start_time, metrics.end_time
+    return (_METRICS_TEMPLATE % (
+        _encode_str(metrics.pipeline_id),
+        f'"{start_time.isoformat()}"' if start_time else 'null',
+        f'"{end_time.isoformat()}"' if end_time else 'null',
+        _encode_str(metrics.status),
+        _encode_str(metrics.stage),
+        _encode_str(metrics.file_path),
+        metrics.rows_processed,
+        _encode_str(metrics.error_message),
+        execution_time,
+        quality_score,
+        memory_usage
+    )).encode()
 
 
 class MetricsCollector:
@@ -54,16 +218,26 @@ class MetricsCollector:
         self.metrics_dir = Path(metrics_dir)
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
         self.current_metrics: Dict[str, PipelineMetrics] = {}
+        self._writer = _BackgroundWriter("metrics-writer")
+    
+    def flush(self):
+        """Wait until all queued metrics are on disk"""
+        self._writer.flush()
+    
+    def close(self):
+        """Write out queued metrics and stop the background writer"""
+        self._writer.close()
         
     def start_pipeline_tracking(self, pipeline_id: str, file_path: str = "") -> PipelineMetrics:
         """Start tracking a pipeline execution"""
         metrics = PipelineMetrics(
             pipeline_id=pipeline_id,
             start_time=datetime.now(),
-            file_path=file_path
+            file_path=file_path,
+            _start_monotonic=time.monotonic_ns()
         )
         self.current_metrics[pipeline_id] = metrics
-        logger.info(f"Started tracking pipeline: {pipeline_id}")
+        logger.info("Started tracking pipeline: %s", pipeline_id)
         return metrics
     
     def update_stage(self, pipeline_id: str, stage: str, rows_processed: int = 0):
@@ -71,19 +245,42 @@ class MetricsCollector:
         if pipeline_id in self.current_metrics:
             self.current_metrics[pipeline_id].stage = stage
             self.current_metrics[pipeline_id].rows_processed = rows_processed
-            logger.info(f"Pipeline {pipeline_id} - Stage: {stage}, Rows: {rows_processed}")
+            logger.info("Pipeline %s - Stage: %s, Rows: %s", pipeline_id, stage, rows_processed)
+    
+    # Minimum gap between progress log lines of one run while its stage is unchanged
+    PROGRESS_LOG_INTERVAL_NS = 1_000_000_000
+    
+    def record_stage_transition(self, pipeline_id: str, stage: str, rows_processed: int = 0):
+        """
+        Update a run's stage and row count, logging at most once per interval
+        
+        Cheap enough to call once per chunk: the metrics object is updated in
+        place, and a log line is only written when the stage changes or
+        PROGRESS_LOG_INTERVAL_NS has passed since the last one.
+        """
+        metrics = self.current_metrics.get(pipeline_id)
+        if metrics is None:
+            return
+        stage_changed = metrics.stage != stage
+        metrics.stage = stage
+        metrics.rows_processed = rows_processed
+        
+        now = time.monotonic_ns()
+        if stage_changed or now - metrics._last_progress_log >= self.PROGRESS_LOG_INTERVAL_NS:
+            metrics._last_progress_log = now
+            logger.info("Pipeline %s - Stage: %s, Rows: %s", pipeline_id, stage, rows_processed)
     
     def finish_pipeline_tracking(self, pipeline_id: str, status: str, error_message: str = ""):
         """Finish tracking and save metrics"""
         if pipeline_id not in self.current_metrics:
-            logger.warning(f"Pipeline {pipeline_id} not found in tracking")
+            logger.warning("Pipeline %s not found in tracking", pipeline_id)
             return
             
         metrics = self.current_metrics[pipeline_id]
         metrics.end_time = datetime.now()
         metrics.status = status
         metrics.error_message = error_message
-        metrics.execution_time_seconds = (metrics.end_time - metrics.start_time).total_seconds()
+        metrics.execution_time_seconds = (time.monotonic_ns() - metrics._start_monotonic) / 1e9
         
         # Save metrics to file
         self._save_metrics(metrics)
@@ -91,31 +288,35 @@ class MetricsCollector:
         # Remove from current tracking
         del self.current_metrics[pipeline_id]
         
-        logger.info(f"Finished tracking pipeline: {pipeline_id} - Status: {status}")
+        logger.info("Finished tracking pipeline: %s - Status: %s", pipeline_id, status)
         return metrics
     
     def _save_metrics(self, metrics: PipelineMetrics):
-        """Save metrics to JSON file"""
+        """Append metrics as one line of the day's JSONL file"""
         try:
             date_str = metrics.start_time.strftime("%Y%m%d")
-            metrics_file = self.metrics_dir / f"pipeline_metrics_{date_str}.json"
-            
-            # Load existing metrics or create new list
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    existing_metrics = json.load(f)
-            else:
-                existing_metrics = []
+            metrics_file = self.metrics_dir / f"pipeline_metrics_{date_str}.jsonl"
             
-            # Add new metrics
-            existing_metrics.append(metrics.to_dict())
-            
-            # Save updated metrics
-            with open(metrics_file, 'w') as f:
-                json.dump(existing_metrics, f, indent=2)
+            # One append per finish, performed by the background writer;
+            # earlier records are never rewritten
+            self._writer.write(metrics_file, _encode_metrics(metrics) + b"\n")
                 
         except Exception as e:
-            logger.error(f"Failed to save metrics: {str(e)}")
+            logger.error("Failed to save metrics: %s", e)
+    
+    def _iter_daily_metrics(self, date_str: str) -> Iterator[Dict[str, Any]]:
+        """Yield the day's metrics records, oldest first"""
+        # Files written before the switch to JSONL hold a single JSON list
+        legacy_file = self.metrics_dir / f"pipeline_metrics_{date_str}.json"
+        if legacy_file.exists():
+            yield from _loads(legacy_file.read_bytes())
+        
+        metrics_file = self.metrics_dir / f"pipeline_metrics_{date_str}.jsonl"
+        if metrics_file.exists():
+            # One read of the whole file, then split in memory
+            for line in metrics_file.read_bytes().splitlines():
+                if line.strip():
+                    yield _loads(line)
     
     def get_daily_summary(self, date: datetime = None) -> Dict[str, Any]:
         """Get summary statistics for a day"""
@@ -123,21 +324,33 @@ class MetricsCollector:
             date = datetime.now()
             
         date_str = date.strftime("%Y%m%d")
-        metrics_file = self.metrics_dir / f"pipeline_metrics_{date_str}.json"
         
-        if not metrics_file.exists():
+        # Include metrics still waiting in the writer queue
+        self.flush()
+        
+        if not (self.metrics_dir / f"pipeline_metrics_{date_str}.jsonl").exists() and \
+                not (self.metrics_dir / f"pipeline_metrics_{date_str}.json").exists():
             return {"date": date_str, "total_runs": 0, "success_rate": 0}
         
         try:
-            with open(metrics_file, 'r') as f:
-                daily_metrics = json.load(f)
+            # Accumulate every counter in one streaming pass over the records
+            total_runs = 0
+            successful_runs = 0
+            total_rows = 0
+            total_execution_time = 0
+            failed_pipelines = []
+            for m in self._iter_daily_metrics(date_str):
+                total_runs += 1
+                status = m['status']
+                if status == 'success':
+                    successful_runs += 1
+                elif status == 'failed':
+                    failed_pipelines.append(m)
+                total_rows += m.get('rows_processed', 0)
+                total_execution_time += m.get('execution_time_seconds', 0)
             
-            total_runs = len(daily_metrics)
-            successful_runs = sum(1 for m in daily_metrics if m['status'] == 'success')
             failed_runs = total_runs - successful_runs
-            
-            total_rows = sum(m.get('rows_processed', 0) for m in daily_metrics)
-            avg_execution_time = sum(m.get('execution_time_seconds', 0) for m in daily_metrics) / total_runs if total_runs > 0 else 0
+            avg_execution_time = total_execution_time / total_runs if total_runs > 0 else 0
             
             return {
                 "date": date_str,
@@ -147,11 +360,11 @@ class MetricsCollector:
                 "success_rate": (successful_runs / total_runs * 100) if total_runs > 0 else 0,
                 "total_rows_processed": total_rows,
                 "average_execution_time": round(avg_execution_time, 2),
-                "failed_pipelines": [m for m in daily_metrics if m['status'] == 'failed']
+                "failed_pipelines": failed_pipelines
             }
             
         except Exception as e:
-            logger.error(f"Failed to generate daily summary: {str(e)}")
+            logger.error("Failed to generate daily summary: %s", e)
             return {"date": date_str, "error": str(e)}
 
 
@@ -169,6 +382,21 @@ class AlertingSystem:
             'data_quality_threshold': 80  # minimum data quality score
         }
         self.consecutive_failures = 0
+        # Failure flags of the most recent runs, newest last
+        self._recent_statuses = deque(maxlen=20)
+        # Guards the failure tracking above when pipelines run concurrently
+        self._status_lock = threading.Lock()
+        self._writer = _BackgroundWriter("alert-writer")
+        # From/To header lines, fixed for this configuration
+        self._email_header = self._build_email_header() if self.config.get('email_alerts_enabled') else None
+    
+    def flush(self):
+        """Wait until all queued alert files are on disk"""
+        self._writer.flush()
+    
+    def close(self):
+        """Write out queued alert files and stop the background writer"""
+        self._writer.close()
         
     def check_pipeline_health(self, metrics: PipelineMetrics) -> List[str]:
         """Check pipeline health and return list of alerts"""
@@ -179,14 +407,17 @@ class AlertingSystem:
             alerts.append(f"SLOW_EXECUTION: Pipeline took {metrics.execution_time_seconds:.2f}s (threshold: {self.alert_thresholds['max_execution_time']}s)")
         
         # Check failure status
-        if metrics.status == 'failed':
-            self.consecutive_failures += 1
-            alerts.append(f"PIPELINE_FAILURE: {metrics.error_message}")
-            
-            if self.consecutive_failures >= self.alert_thresholds['max_failed_runs']:
-                alerts.append(f"CRITICAL: {self.consecutive_failures} consecutive failures")
-        else:
-            self.consecutive_failures = 0
+        failed = metrics.status == 'failed'
+        with self._status_lock:
+            self._recent_statuses.append(failed)
+            if failed:
+                self.consecutive_failures += 1
+                alerts.append(f"PIPELINE_FAILURE: {metrics.error_message}")
+                
+                if self.consecutive_failures >= self.alert_thresholds['max_failed_runs']:
+                    alerts.append(f"CRITICAL: {self.consecutive_failures} consecutive failures")
+            else:
+                self.consecutive_failures = 0
         
         # Check data quality
         if metrics.data_quality_score < self.alert_thresholds['data_quality_threshold']:
@@ -194,6 +425,12 @@ class AlertingSystem:
         
         return alerts
     
+    def recent_failures(self, window: int = None) -> int:
+        """Number of failed runs among the last `window` checked (default: all kept)"""
+        if window is None or window >= len(self._recent_statuses):
+            return sum(self._recent_statuses)
+        return sum(list(self._recent_statuses)[-window:])
+    
     def send_alert(self, alert_type: str, message: str, pipeline_metrics: PipelineMetrics = None):
         """Send alert notification"""
         alert_message = f"[ETL ALERT - {alert_type}] {message}"
@@ -221,6 +458,12 @@ Pipeline Details:
         # Write to alert file
         self._write_alert_file(alert_type, alert_message, pipeline_metrics)
     
+    def _build_email_header(self) -> str:
+        """Build the From/To header lines from the alerting configuration"""
+        sender_email = self.config.get('sender_email', 'etl-alerts@company.com')
+        recipient_emails = self.config.get('recipient_emails', [])
+        return f"From: {sender_email}\nTo: {', '.join(recipient_emails)}\n"
+    
     def _send_email_alert(self, alert_type: str, message: str):
         """Send email alert (requires email configuration)"""
         try:
@@ -234,12 +477,13 @@ Pipeline Details:
                 logger.warning("No recipient emails configured for alerts")
                 return
             
+            if self._email_header is None:
+                self._email_header = self._build_email_header()
+            
             # Simple email without MIME (for basic functionality)
             email_body = f"""
 Subject: ETL Pipeline Alert: {alert_type}
-From: {sender_email}
-To: {', '.join(recipient_emails)}
-
+{self._email_header}
 {message}
 """
             
@@ -249,30 +493,33 @@ To: {', '.join(recipient_emails)}
             #     server.login(sender_email, password)
             #     server.sendmail(sender_email, recipient_emails, email_body)
             
-            logger.info(f"Email alert prepared: {alert_type}")
+            logger.info("Email alert prepared: %s", alert_type)
             
         except Exception as e:
-            logger.error(f"Failed to send email alert: {str(e)}")
+            logger.error("Failed to send email alert: %s", e)
     
     def _write_alert_file(self, alert_type: str, message: str, pipeline_metrics: PipelineMetrics = None):
-        """Write alert to file for monitoring systems to pick up"""
+        """Append alert to the day's alert log for monitoring systems to pick up"""
         try:
             alerts_dir = Path("logs/alerts")
             alerts_dir.mkdir(parents=True, exist_ok=True)
             
+            # One clock read for both the record and the file it goes to
+            now = datetime.now()
             alert_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "alert_type": alert_type,
                 "message": message,
                 "pipeline_metrics": pipeline_metrics.to_dict() if pipeline_metrics else None
             }
             
-            alert_file = alerts_dir / f"alert_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(alert_file, 'w') as f:
-                json.dump(alert_data, f, indent=2)
+            # All of a day's alerts go to one JSONL file, one line per alert
+            alert_file = alerts_dir / f"alerts_{now.strftime('%Y%m%d')}.jsonl"
+            # Serialize here; the background writer does the file I/O
+            self._writer.write(alert_file, _dumps(alert_data) + b"\n")
                 
         except Exception as e:
-            logger.error(f"Failed to write alert file: {str(e)}")
+            logger.error("Failed to write alert file: %s", e)
 
 
 class HealthChecker:
@@ -280,16 +527,49 @@ class HealthChecker:
     Monitors overall system health and dependencies
     """
     
-    def __init__(self):
+    # Seconds a check result is reused before the check runs again
+    DEFAULT_CHECK_TTLS = {
+        'database_connection': 10.0,
+        'disk_space': 30.0,
+        'memory_usage': 2.0,
+        'input_directory': 5.0
+    }
+    
+    def __init__(self, check_ttls: Optional[Dict[str, float]] = None):
         self.health_checks = {
             'database_connection': self._check_database,
             'disk_space': self._check_disk_space,
             'memory_usage': self._check_memory,
             'input_directory': self._check_input_directory
         }
+        self.check_ttls = {**self.DEFAULT_CHECK_TTLS, **(check_ttls or {})}
+        # check name -> (time.monotonic() when run, result)
+        self._cache: Dict[str, Any] = {}
+        # Working directory filesystem stats, shared by the checks of one run
+        self._fs_stat = None
+        # Pooled engine and ping statement, created by the first database check
+        self._engine = None
+        self._ping = None
+    
+    def _filesystem_stat(self) -> Any:
+        """os.statvfs(".") taken at most once per health-check run"""
+        if self._fs_stat is None:
+            self._fs_stat = os.statvfs(".")
+        return self._fs_stat
+    
+    def _run_check(self, check_name: str, check_func) -> Dict[str, Any]:
+        """Run a check, or reuse its last result while within the check's TTL"""
+        now = time.monotonic()
+        entry = self._cache.get(check_name)
+        if entry is not None and now - entry[0] < self.check_ttls.get(check_name, 0):
+            return entry[1]
+        result = check_func()
+        self._cache[check_name] = (now, result)
+        return result
     
     def run_health_checks(self) -> Dict[str, Any]:
-        """Run all health checks"""
+        """Run all health checks, reusing results younger than their TTL"""
+        self._fs_stat = None
         health_status = {
             "timestamp": datetime.now().isoformat(),
             "overall_status": "healthy",
@@ -298,7 +578,7 @@ class HealthChecker:
         
         for check_name, check_func in self.health_checks.items():
             try:
-                result = check_func()
+                result = self._run_check(check_name, check_func)
                 health_status["checks"][check_name] = result
                 
                 if not result.get("status") == "ok":
@@ -311,15 +591,22 @@ class HealthChecker:
                 }
                 health_status["overall_status"] = "unhealthy"
         
+        self._fs_stat = None
         return health_status
     
     def _check_database(self) -> Dict[str, Any]:
         """Check database connectivity"""
         try:
-            from load import connect_to_postgres
-            engine = connect_to_postgres()
-            with engine.connect() as conn:
-                conn.execute("SELECT 1")
+            if self._engine is None:
+                from sqlalchemy import text
+                from .load import connect_to_postgres
+                # connect_to_postgres pings once itself; later checks reuse
+                # its pooled engine and only run the ping below
+                self._engine = connect_to_postgres()
+                self._ping = text("SELECT 1")
+            else:
+                with self._engine.connect() as conn:
+                    conn.execute(self._ping)
             return {"status": "ok", "message": "Database connection successful"}
         except Exception as e:
             return {"status": "error", "message": f"Database connection failed: {str(e)}"}
@@ -327,8 +614,10 @@ class HealthChecker:
     def _check_disk_space(self) -> Dict[str, Any]:
         """Check available disk space"""
         try:
-            import shutil
-            total, used, free = shutil.disk_usage(".")
+            fs = self._filesystem_stat()
+            total = fs.f_blocks * fs.f_frsize
+            used = (fs.f_blocks - fs.f_bfree) * fs.f_frsize
+            free = fs.f_bavail * fs.f_frsize
             free_gb = free / (1024**3)
             usage_percent = (used / total) * 100
             
@@ -362,10 +651,12 @@ class HealthChecker:
             if not input_dir.exists():
                 return {"status": "error", "message": "Input directory does not exist"}
             
-            # Count files waiting to be processed
-            csv_files = list(input_dir.glob("*.csv"))
-            json_files = list(input_dir.glob("*.json"))
-            total_files = len(csv_files) + len(json_files)
+            # Count files waiting to be processed in one directory pass
+            total_files = 0
+            with os.scandir(input_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.csv', '.json')):
+                        total_files += 1
             
             if total_files > 100:
                 return {"status": "warning", "message": f"Large backlog: {total_files} files waiting"}
@@ -10,8 +10,10 @@ This module orchestrates the complete ETL process by coordinating:
 Purpose: Enable analyst queries like "Show me active users over 30 who signed up last week"
 """
 
+import os
 import time
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Import our ETL modules
@@ -24,14 +26,13 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+# Stage that runs after N completed stages; anything past load is unknown
+_STAGES = ('extract', 'transform', 'load', 'unknown')
+
+
 def get_current_stage(stages_completed):
     """Helper function to determine which stage failed"""
-    stage_mapping = {
-        0: 'extract',
-        1: 'transform', 
-        2: 'load'
-    }
-    return stage_mapping.get(len(stages_completed), 'unknown')
+    return _STAGES[min(len(stages_completed), 3)]
 
 
 def run_etl_pipeline(file_path, verbose=True):
@@ -67,7 +68,7 @@ def run_etl_pipeline(file_path, verbose=True):
     stages_completed = []
     file_name = Path(file_path).name
     
-    logger.info(f"🚀 Starting ETL pipeline for file: {file_name}")
+    logger.info("🚀 Starting ETL pipeline for file: %s", file_name)
     
     try:
         # Stage 1: Extract Data
@@ -79,7 +80,7 @@ def run_etl_pipeline(file_path, verbose=True):
         
         if verbose:
             print(f"   ✅ Extracted {len(raw_data)} rows from {file_name}")
-        logger.info(f"Extract stage completed: {len(raw_data)} rows extracted")
+        logger.info("Extract stage completed: %s rows extracted", len(raw_data))
         
         # Stage 2: Transform Data
         if verbose:
@@ -90,7 +91,7 @@ def run_etl_pipeline(file_path, verbose=True):
         
         if verbose:
             print(f"   ✅ Transformed data: {len(clean_data)} clean rows ready")
-        logger.info(f"Transform stage completed: {len(clean_data)} rows cleaned")
+        logger.info("Transform stage completed: %s rows cleaned", len(clean_data))
         
         # Stage 3: Load Data  
         if verbose:
@@ -101,7 +102,7 @@ def run_etl_pipeline(file_path, verbose=True):
         
         if verbose:
             print(f"   ✅ Loaded {load_result['rows_loaded']} rows into database")
-        logger.info(f"Load stage completed: {load_result['rows_loaded']} rows loaded")
+        logger.info("Load stage completed: %s rows loaded", load_result['rows_loaded'])
         
         # Calculate execution time
         pipeline_time = time.time() - pipeline_start
@@ -120,7 +121,8 @@ def run_etl_pipeline(file_path, verbose=True):
         
         if verbose:
             print(f"🎉 Pipeline completed successfully in {result['execution_time']}")
-        logger.info(f"Pipeline completed successfully: {result}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Pipeline completed successfully: %s", result)
         
         return result
         
@@ -141,15 +143,18 @@ def run_etl_pipeline(file_path, verbose=True):
         
         if verbose:
             print(f"❌ Pipeline failed at {failed_stage} stage: {str(e)}")
-        logger.error(f"Pipeline failed: {error_result}")
+        logger.error("Pipeline failed: %s", error_result)
         
         return error_result
 
 
-def run_batch_pipeline(input_directory, file_pattern="*.csv", verbose=True):
+def run_batch_pipeline(input_directory, file_pattern="*.csv", verbose=True, max_workers=None):
     """
     Run ETL pipeline on multiple files in a directory
     
+    Files are independent, so each one runs in its own worker process;
+    results are collected as workers finish and returned in file order.
+    
     Parameters:
     -----------
     input_directory : str
@@ -158,6 +163,8 @@ def run_batch_pipeline(input_directory, file_pattern="*.csv", verbose=True):
         File pattern to match (default: "*.csv")
     verbose : bool, optional
         Print progress messages (default: True)
+    max_workers : int, optional
+        Worker processes to use (default: one per file, up to the CPU count)
         
     Returns:
     --------
@@ -165,7 +172,9 @@ def run_batch_pipeline(input_directory, file_pattern="*.csv", verbose=True):
         Batch processing results
     """
     input_path = Path(input_directory)
-    files = list(input_path.glob(file_pattern))
+    # One glob pass; each file's path string and name are derived once here.
+    # The count is needed up front to size the pool and report progress.
+    files = [(str(file_path), file_path.name) for file_path in input_path.glob(file_pattern)]
     
     if not files:
         return {
@@ -177,25 +186,48 @@ def run_batch_pipeline(input_directory, file_pattern="*.csv", verbose=True):
     if verbose:
         print(f"🚀 Starting batch ETL pipeline for {len(files)} files")
     
-    results = []
+    results = [None] * len(files)
     successful_files = 0
     failed_files = 0
     
-    for file_path in files:
-        if verbose:
-            print(f"\n📁 Processing file: {file_path.name}")
-            
-        result = run_etl_pipeline(str(file_path), verbose=False)  # Less verbose for batch
-        results.append(result)
+    if max_workers is None:
+        max_workers = min(len(files), os.cpu_count() or 1)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Submit every file up front, then reap results as they complete
+        futures = {
+            executor.submit(run_etl_pipeline, path, False): index  # Less verbose for batch
+            for index, (path, _) in enumerate(files)
+        }
         
-        if result['success']:
-            successful_files += 1
-            if verbose:
-                print(f"   ✅ {file_path.name}: {result['rows_loaded']} rows loaded")
-        else:
-            failed_files += 1
+        for future in as_completed(futures):
+            index = futures[future]
+            name = files[index][1]
             if verbose:
-                print(f"   ❌ {file_path.name}: {result['message']}")
+                print(f"\n📁 Processed file: {name}")
+            
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died; keep the failure isolated to this file
+                result = {
+                    'success': False,
+                    'stages_completed': [],
+                    'failed_stage': 'unknown',
+                    'file_processed': name,
+                    'error': str(e),
+                    'message': f'Pipeline worker failed: {str(e)}'
+                }
+            results[index] = result
+            
+            if result['success']:
+                successful_files += 1
+                if verbose:
+                    print(f"   ✅ {name}: {result['rows_loaded']} rows loaded")
+            else:
+                failed_files += 1
+                if verbose:
+                    print(f"   ❌ {name}: {result['message']}")
     
     batch_result = {
         'success': failed_files == 0,
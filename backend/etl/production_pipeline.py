@@ -11,11 +11,17 @@ Enterprise-level ETL pipeline with:
 - Comprehensive error handling
 """
 
+import os
 import time
 import uuid
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Iterator
+
+import pandas as pd
 
 # Import our core ETL modules
 from .extractor import extract_data
@@ -34,11 +40,65 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+def _prefetch(chunks: Iterable, depth: int = 2) -> Iterator:
+    """
+    Yield from chunks while a reader thread produces up to depth ahead
+    
+    Reader errors are re-raised in the consumer; if the consumer stops
+    early, the reader is told to stop and the source is closed.
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    end = object()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put((chunk, None)):
+                    return
+            put((end, None))
+        except Exception as e:
+            put((end, e))
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+    
+    reader = threading.Thread(target=produce, name="etl-chunk-reader", daemon=True)
+    reader.start()
+    try:
+        while True:
+            chunk, error = buffer.get()
+            if chunk is end:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        stop.set()
+
+
 class ProductionETLPipeline:
     """
     Production-grade ETL pipeline with enterprise features
     """
     
+    # Default retry budget per run in seconds; override with the
+    # 'retry_budget' config key or pipeline option
+    DEFAULT_RETRY_BUDGET = 30.0
+    # Rows per chunk for batch files over split_threshold_mb when no
+    # chunk_size is configured
+    DEFAULT_SPLIT_CHUNK_SIZE = 100_000
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         
@@ -50,9 +110,28 @@ class ProductionETLPipeline:
         self.alerting_system = AlertingSystem(self.config.get('alerting', {}))
         self.health_checker = HealthChecker()
         self.schema_manager = SchemaEvolutionManager()
+        # Pooled engine shared by every run; connected on first use so the
+        # pipeline can be built while the database is unreachable
+        self._engine = None
+        # Schema evolution updates the shared registry and the table, so
+        # concurrent batch workers take turns through it
+        self._schema_lock = threading.Lock()
+        # (time.monotonic(), result) of the last system health check; reused
+        # for health_check_ttl_s seconds and dropped after a failed run
+        self._health_cache = None
         
         logger.info("Production ETL Pipeline initialized")
     
+    def _get_engine(self):
+        """Return the shared pooled engine, connecting on first use"""
+        if self._engine is None:
+            self._engine = connect_to_postgres()
+        return self._engine
+    
+    def _load(self, clean_data):
+        """Load through the shared engine"""
+        return load_data(clean_data, engine=self._get_engine())
+    
     def run_pipeline(self, file_path: str, pipeline_options: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Run production ETL pipeline with full monitoring and error handling
@@ -62,7 +141,8 @@ class ProductionETLPipeline:
         file_path : str
             Path to input file
         pipeline_options : dict, optional
-            Pipeline configuration options
+            Pipeline configuration options (e.g. skip_schema_evolution,
+            retry_budget in seconds)
             
         Returns:
         --------
@@ -70,6 +150,9 @@ class ProductionETLPipeline:
             Comprehensive pipeline execution results
         """
         options = pipeline_options or {}
+        # Seconds all retries of this run may spend waiting, across stages
+        retry_budget = options.get('retry_budget', self.config.get('retry_budget', self.DEFAULT_RETRY_BUDGET))
+        retry_deadline = time.monotonic() + retry_budget
         pipeline_id = f"pipeline_{uuid.uuid4().hex[:8]}_{int(time.time())}"
         
         # Start metrics tracking
@@ -79,50 +162,32 @@ class ProductionETLPipeline:
         logger.info(f"📁 Processing file: {file_path}")
         
         try:
+            # Large CSVs stream through the stages in chunks of chunk_size rows
+            chunk_size = options.get('chunk_size', self.config.get('chunk_size'))
+            chunked = bool(chunk_size) and Path(file_path).suffix.lower() == '.csv'
+            
             # Stage 0: Pre-flight checks
             logger.info("🔍 Running pre-flight checks...")
-            preflight_result = self._run_preflight_checks(file_path)
+            preflight_result = self._run_preflight_checks(file_path, streamed=chunked)
             
             if not preflight_result['passed']:
                 raise Exception(f"Pre-flight checks failed: {preflight_result['issues']}")
             
-            # Stage 1: Extract with validation and retry
-            logger.info("📥 Stage 1: Extract")
-            self.metrics_collector.update_stage(pipeline_id, "extract", 0)
-            
-            raw_data = self.retry_handler.retry_with_backoff(self._extract_with_validation, file_path)
-            logger.info(f"✅ Extracted {len(raw_data)} rows")
-            
-            # Stage 2: Transform with schema evolution
-            logger.info("🔄 Stage 2: Transform with schema evolution")
-            self.metrics_collector.update_stage(pipeline_id, "transform", len(raw_data))
-            
-            # Get database engine for schema evolution
-            engine = connect_to_postgres() if not options.get('skip_schema_evolution') else None
-            
-            # Apply schema evolution
-            transformed_data, evolution_report = self.schema_manager.process_data_with_schema_evolution(
-                raw_data, engine
-            )
-            
-            # Apply standard transformations
-            clean_data = transform(transformed_data)
-            logger.info(f"✅ Transformed {len(clean_data)} rows")
-            
-            if evolution_report['schema_changed']:
-                logger.info(f"📋 Schema evolution: {evolution_report['actions_taken']}")
+            evolve_schema = not options.get('skip_schema_evolution')
             
-            # Stage 3: Load with monitoring
-            logger.info("💾 Stage 3: Load")
-            self.metrics_collector.update_stage(pipeline_id, "load", len(clean_data))
-            
-            load_result = self.retry_handler.retry_with_backoff(load_data, clean_data)
-            logger.info(f"✅ Loaded {load_result['rows_loaded']} rows")
+            # Stages 1-3: Extract, transform, load
+            if chunked:
+                stage_result = self._run_stages_chunked(
+                    pipeline_id, file_path, int(chunk_size), evolve_schema, retry_deadline
+                )
+            else:
+                stage_result = self._run_stages(pipeline_id, file_path, evolve_schema, retry_deadline)
+            evolution_report = stage_result['schema_evolution']
             
             # Stage 4: Post-processing
             logger.info("✨ Stage 4: Post-processing")
             post_result = self._post_processing(file_path, {
-                'rows_processed': len(clean_data),
+                'rows_processed': stage_result['rows_transformed'],
                 'execution_time': f"{time.time() - metrics.start_time.timestamp():.2f}s"
             })
             
@@ -141,9 +206,9 @@ class ProductionETLPipeline:
                 'pipeline_id': pipeline_id,
                 'file_processed': Path(file_path).name,
                 'stages_completed': ['extract', 'transform', 'load', 'post_processing'],
-                'rows_extracted': len(raw_data),
-                'rows_transformed': len(clean_data),
-                'rows_loaded': load_result['rows_loaded'],
+                'rows_extracted': stage_result['rows_extracted'],
+                'rows_transformed': stage_result['rows_transformed'],
+                'rows_loaded': stage_result['rows_loaded'],
                 'execution_time': final_metrics.execution_time_seconds,
                 'schema_evolution': evolution_report,
                 'data_quality': preflight_result.get('data_quality', {}),
@@ -166,6 +231,9 @@ class ProductionETLPipeline:
             # Send failure alerts
             self.alerting_system.send_alert("PIPELINE_FAILURE", str(e), final_metrics)
             
+            # The system may be what failed; the next run checks health afresh
+            self._health_cache = None
+            
             # Quarantine problematic file
             quarantine_path = self.dlq.quarantine_file(file_path, {
                 'stage': final_metrics.stage,
@@ -187,7 +255,7 @@ class ProductionETLPipeline:
                 'message': f'Production pipeline failed: {pipeline_id} - {str(e)}'
             }
     
-    def _run_preflight_checks(self, file_path: str) -> Dict[str, Any]:
+    def _run_preflight_checks(self, file_path: str, streamed: bool = False) -> Dict[str, Any]:
         """Run comprehensive pre-flight checks"""
         checks_result = {
             'passed': True,
@@ -199,14 +267,14 @@ class ProductionETLPipeline:
         
         try:
             # System health checks
-            health_status = self.health_checker.run_health_checks()
+            health_status = self._get_health_status()
             checks_result['health_status'] = health_status
             
             if health_status['overall_status'] != 'healthy':
                 checks_result['warnings'].append(f"System health issues detected")
             
             # File validation
-            file_validation = self.data_validator.validate_file(file_path)
+            file_validation = self.data_validator.validate_file(file_path, streamed=streamed)
             checks_result['data_quality'] = file_validation
             
             if not file_validation['is_valid']:
@@ -223,19 +291,140 @@ class ProductionETLPipeline:
             checks_result['issues'].append(f"Pre-flight check error: {str(e)}")
             return checks_result
     
-    def _extract_with_validation(self, file_path: str):
-        """Extract data with additional validation"""
-        # Extract data
-        raw_data = extract_data(file_path)
+    def _run_stages(self, pipeline_id: str, file_path: str, evolve_schema: bool,
+                    retry_deadline: float) -> Dict[str, Any]:
+        """Extract, transform and load the whole file at once"""
+        # Stage 1: Extract with validation and retry
+        logger.info("📥 Stage 1: Extract")
+        self.metrics_collector.record_stage_transition(pipeline_id, "extract", 0)
         
-        # Validate extracted data quality
-        quality_report = self.data_validator.validate_data_quality(raw_data)
+        raw_data = self.retry_handler.retry_with_backoff(
+            self._extract_with_validation, file_path, retry_deadline=retry_deadline
+        )
+        logger.info(f"✅ Extracted {len(raw_data)} rows")
+        
+        # Stage 2: Transform with schema evolution
+        logger.info("🔄 Stage 2: Transform with schema evolution")
+        self.metrics_collector.record_stage_transition(pipeline_id, "transform", len(raw_data))
+        
+        # Get database engine for schema evolution
+        engine = self._get_engine() if evolve_schema else None
+        
+        # Apply schema evolution
+        with self._schema_lock:
+            transformed_data, evolution_report = self.schema_manager.process_data_with_schema_evolution(
+                raw_data, engine
+            )
+        
+        # Apply standard transformations
+        clean_data = transform(transformed_data)
+        logger.info(f"✅ Transformed {len(clean_data)} rows")
+        
+        if evolution_report['schema_changed']:
+            logger.info(f"📋 Schema evolution: {evolution_report['actions_taken']}")
+        
+        # Stage 3: Load with monitoring
+        logger.info("💾 Stage 3: Load")
+        self.metrics_collector.record_stage_transition(pipeline_id, "load", len(clean_data))
+        
+        load_result = self.retry_handler.retry_with_backoff(
+            self._load, clean_data, retry_deadline=retry_deadline
+        )
+        logger.info(f"✅ Loaded {load_result['rows_loaded']} rows")
+        
+        return {
+            'rows_extracted': len(raw_data),
+            'rows_transformed': len(clean_data),
+            'rows_loaded': load_result['rows_loaded'],
+            'schema_evolution': evolution_report
+        }
+    
+    def _run_stages_chunked(self, pipeline_id: str, file_path: str, chunk_size: int,
+                            evolve_schema: bool, retry_deadline: float) -> Dict[str, Any]:
+        """
+        Stream a CSV through extract, transform and load chunk by chunk
+        
+        Peak memory is bounded by a few chunks instead of the whole file; the
+        next chunk is parsed on a reader thread while the current one is
+        transformed and loaded. Quality validation and schema evolution run
+        per chunk, and metrics carry running row counts.
+        """
+        logger.info(f"📥 Streaming {file_path} in chunks of {chunk_size} rows")
+        self.metrics_collector.record_stage_transition(pipeline_id, "extract", 0)
+        
+        rows_extracted = rows_transformed = rows_loaded = 0
+        evolution_report = None
+        engine = None
+        
+        for chunk in _prefetch(pd.read_csv(file_path, chunksize=chunk_size)):
+            self._validate_extracted(chunk)
+            rows_extracted += len(chunk)
+            self.metrics_collector.record_stage_transition(pipeline_id, "transform", rows_extracted)
+            
+            if evolve_schema and engine is None:
+                engine = self._get_engine()
+            with self._schema_lock:
+                transformed_chunk, chunk_report = self.schema_manager.process_data_with_schema_evolution(
+                    chunk, engine
+                )
+            if evolution_report is None:
+                evolution_report = chunk_report
+            elif chunk_report['schema_changed']:
+                evolution_report['schema_changed'] = True
+                evolution_report['actions_taken'].extend(chunk_report['actions_taken'])
+            
+            clean_chunk = transform(transformed_chunk)
+            rows_transformed += len(clean_chunk)
+            self.metrics_collector.record_stage_transition(pipeline_id, "load", rows_transformed)
+            
+            load_result = self.retry_handler.retry_with_backoff(
+                self._load, clean_chunk, retry_deadline=retry_deadline
+            )
+            rows_loaded += load_result['rows_loaded']
+        
+        if evolution_report is None:
+            evolution_report = {"schema_changed": False, "actions_taken": []}
+        elif evolution_report['schema_changed']:
+            logger.info(f"📋 Schema evolution: {evolution_report['actions_taken']}")
+        logger.info(f"✅ Streamed {rows_extracted} rows, loaded {rows_loaded}")
+        
+        return {
+            'rows_extracted': rows_extracted,
+            'rows_transformed': rows_transformed,
+            'rows_loaded': rows_loaded,
+            'schema_evolution': evolution_report
+        }
+    
+    def _validate_extracted(self, raw_data):
+        """Raise on data quality issues in extracted data, log warnings"""
+        quality_report = self.data_validator.validate_data_quality(
+            raw_data, sample_rate=self.config.get('validation_sample_rate', 0.01)
+        )
         
         if quality_report['issues']:
             raise Exception(f"Data quality issues: {quality_report['issues']}")
         
         if quality_report['warnings']:
             logger.warning(f"Data quality warnings: {quality_report['warnings']}")
+    
+    def _get_health_status(self) -> Dict[str, Any]:
+        """System health, re-checked at most once per health_check_ttl_s"""
+        ttl = self.config.get('health_check_ttl_s', 30.0)
+        cached = self._health_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        health_status = self.health_checker.run_health_checks()
+        self._health_cache = (now, health_status)
+        return health_status
+    
+    def _extract_with_validation(self, file_path: str):
+        """Extract data with additional validation"""
+        # Extract data
+        raw_data = extract_data(file_path)
+        
+        # Validate extracted data quality
+        self._validate_extracted(raw_data)
         
         return raw_data
     
@@ -256,10 +445,26 @@ class ProductionETLPipeline:
             logger.warning(f"Post-processing issues: {str(e)}")
             return {'error': str(e)}
     
-    def run_batch_pipeline(self, input_directory: str, file_pattern: str = "*.csv") -> Dict[str, Any]:
-        """Run production pipeline on multiple files"""
+    def run_batch_pipeline(self, input_directory: str, file_pattern: str = "*.csv",
+                           pipeline_options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Run production pipeline on multiple files
+        
+        Files run concurrently on config['batch_workers'] workers (default 4):
+        threads by default, or processes with a private pipeline each when
+        pipeline_options['parallelism'] (or config['batch_parallelism']) is
+        'process', for transform-heavy workloads.
+        
+        Files are submitted largest first so a big file does not start last
+        and stall the batch; files over config['split_threshold_mb'] (default:
+        the validator's max_file_size_mb) are streamed in chunks rather than
+        read whole, and so are exempt from that size cap.
+        """
+        options = pipeline_options or {}
         input_path = Path(input_directory)
-        files = list(input_path.glob(file_pattern))
+        sized_files = sorted(((path.stat().st_size, path) for path in input_path.glob(file_pattern)),
+                             key=lambda item: item[0], reverse=True)
+        files = [path for _, path in sized_files]
         
         if not files:
             return {
@@ -270,24 +475,42 @@ class ProductionETLPipeline:
         
         logger.info(f"🚀 Starting batch production pipeline for {len(files)} files")
         
-        batch_results = []
         successful_files = 0
         failed_files = 0
         total_rows_processed = 0
         
-        for file_path in files:
-            logger.info(f"\n📁 Processing: {file_path.name}")
-            
-            result = self.run_pipeline(str(file_path))
-            batch_results.append(result)
-            
+        workers = min(self.config.get('batch_workers', 4), len(files))
+        parallelism = options.get('parallelism', self.config.get('batch_parallelism', 'thread'))
+        paths = [str(file_path) for file_path in files]
+        
+        split_threshold_mb = self.config.get(
+            'split_threshold_mb', self.data_validator.validation_rules['max_file_size_mb'])
+        split_threshold = split_threshold_mb * 1024 * 1024
+        chunk_size = (options.get('chunk_size') or self.config.get('chunk_size')
+                      or self.DEFAULT_SPLIT_CHUNK_SIZE)
+        chunked_options = {**options, 'chunk_size': chunk_size}
+        file_options = [chunked_options if size > split_threshold else options for size, _ in sized_files]
+        
+        # Quarantine metadata is buffered for the batch and flushed once at the end
+        with self.dlq.batch():
+            if parallelism == 'process':
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                         initargs=(self.config,)) as executor:
+                    batch_results = list(executor.map(_run_batch_worker, paths, file_options))
+                # Workers quarantined through their own queue objects
+                self.dlq.reset_quarantined_count()
+            else:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="etl-batch") as executor:
+                    batch_results = list(executor.map(self.run_pipeline, paths, file_options))
+        
+        for file_path, result in zip(files, batch_results):
             if result['success']:
                 successful_files += 1
                 total_rows_processed += result.get('rows_loaded', 0)
-                logger.info(f"   ✅ Success: {result.get('rows_loaded', 0)} rows")
+                logger.info(f"   ✅ {file_path.name}: {result.get('rows_loaded', 0)} rows")
             else:
                 failed_files += 1
-                logger.error(f"   ❌ Failed: {result.get('error', 'Unknown error')}")
+                logger.error(f"   ❌ {file_path.name}: {result.get('error', 'Unknown error')}")
         
         # Batch summary
         batch_result = {
@@ -318,18 +541,37 @@ class ProductionETLPipeline:
         # Daily metrics summary
         daily_summary = self.metrics_collector.get_daily_summary()
         
-        # Quarantined files
-        quarantined_files = self.dlq.get_quarantined_files()
-        
         return {
             'timestamp': datetime.now().isoformat(),
             'health_status': health_status,
             'daily_metrics': daily_summary,
-            'quarantined_files_count': len(quarantined_files),
+            'quarantined_files_count': self.dlq.quarantined_count,
             'current_schema_version': self.schema_manager.registry.get_current_schema().get('version', 'unknown')
         }
 
 
+# Pipeline owned by each batch worker process
+_batch_worker_pipeline: Optional[ProductionETLPipeline] = None
+
+
+def _init_batch_worker(config: Dict[str, Any]):
+    """Build one pipeline per worker process, reused for all its files"""
+    global _batch_worker_pipeline
+    _batch_worker_pipeline = ProductionETLPipeline(config)
+
+
+def _run_batch_worker(file_path: str, pipeline_options: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one file and flush its metrics, alerts and quarantine index"""
+    try:
+        return _batch_worker_pipeline.run_pipeline(file_path, pipeline_options)
+    finally:
+        # Pool workers exit through os._exit, so atexit never drains the
+        # background writers; whatever is still queued would be lost
+        _batch_worker_pipeline.metrics_collector.flush()
+        _batch_worker_pipeline.alerting_system.flush()
+        _batch_worker_pipeline.dlq.flush()
+
+
 # Example usage and demonstration
 if __name__ == "__main__":
     print("Production ETL Pipeline - Demonstration")
@@ -0,0 +1,126 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from etl.data_quality import DataQualityAssessor, ValidationRule, ValidationSeverity
+
+
+def range_rule(column, min_value=None, max_value=None):
+    return ValidationRule(
+        name=f"{column}_range",
+        column=column,
+        rule_type="range",
+        parameters={"min_value": min_value, "max_value": max_value},
+        severity=ValidationSeverity.ERROR,
+        description=f"Range check for {column}"
+    )
+
+
+def sample_frame():
+    """Users with nulls, out-of-range values and duplicate rows far apart"""
+    rng = np.random.default_rng(7)
+    n = 500
+    df = pd.DataFrame({
+        'user_id': np.arange(n),
+        'age': rng.integers(-20, 200, n).astype('float64'),
+        'score': rng.normal(50.0, 15.0, n),
+        'plan': rng.choice(['free', 'pro', None], n),
+    })
+    df.loc[rng.choice(n, 40, replace=False), 'age'] = np.nan
+    # Rows copied from the first chunk into the last, and one within a chunk
+    df.iloc[[480, 490, 495]] = df.iloc[[3, 4, 5]].to_numpy()
+    df.iloc[10] = df.iloc[11].to_numpy()
+    return df.astype({'user_id': 'int64', 'score': 'float64'})
+
+
+class ChunkedAssessmentTest(unittest.TestCase):
+    """assess_data_quality_chunked must agree with a whole-frame assessment"""
+
+    CHUNK_SIZE = 64
+
+    def setUp(self):
+        self.assessor = DataQualityAssessor()
+        self.df = sample_frame()
+        self.rules = [range_rule('age', 0, 150), range_rule('score', max_value=80.0)]
+        self.full = self.assessor.assess_data_quality(self.df, "users", self.rules)
+        chunks = (self.df.iloc[i:i + self.CHUNK_SIZE] for i in range(0, len(self.df), self.CHUNK_SIZE))
+        self.chunked = self.assessor.assess_data_quality_chunked(chunks, "users", self.rules)
+
+    def test_totals_and_duplicates(self):
+        self.assertEqual(self.chunked.total_records, self.full.total_records)
+        self.assertEqual(self.chunked.duplicate_count, 4)
+        self.assertEqual(self.chunked.duplicate_count, self.full.duplicate_count)
+        self.assertAlmostEqual(self.chunked.duplicate_percentage, self.full.duplicate_percentage)
+
+    def test_null_percentages(self):
+        self.assertEqual(self.chunked.null_percentages.keys(), self.full.null_percentages.keys())
+        for col, percentage in self.full.null_percentages.items():
+            self.assertAlmostEqual(self.chunked.null_percentages[col], percentage, msg=col)
+
+    def test_numeric_profiles(self):
+        for col in ('user_id', 'age', 'score'):
+            full_profile = self.full.column_profiles[col]
+            chunked_profile = self.chunked.column_profiles[col]
+            for stat in ('min', 'max', 'mean', 'std'):
+                self.assertAlmostEqual(chunked_profile[stat], full_profile[stat], places=9,
+                                       msg=f"{col} {stat}")
+
+    def test_rule_results(self):
+        full_results = {r.rule_name: r for r in self.full.validation_results}
+        chunked_results = {r.rule_name: r for r in self.chunked.validation_results}
+        self.assertEqual(chunked_results.keys(), full_results.keys())
+        for name, expected in full_results.items():
+            actual = chunked_results[name]
+            self.assertEqual(actual.passed, expected.passed, name)
+            self.assertEqual(actual.failed_count, expected.failed_count, name)
+            self.assertEqual(actual.message, expected.message, name)
+        for name in ('age_range', 'score_range'):
+            self.assertGreater(full_results[name].failed_count, 5)
+            self.assertEqual(chunked_results[name].total_count, full_results[name].total_count)
+            self.assertEqual(chunked_results[name].sample_failed_values,
+                             full_results[name].sample_failed_values)
+
+
+class CompiledRangeRulesTest(unittest.TestCase):
+    """compile_rules must give what _check_value_range gives per rule"""
+
+    def setUp(self):
+        self.assessor = DataQualityAssessor()
+        self.df = pd.DataFrame({
+            'age': np.array([5, -1, 200, 40, 151, 0], dtype='int64'),
+            'height': np.array([1.2, 2.5, -0.1, np.nan, 1.8, 3.0]),
+            'visits': pd.array([3, None, 12, 7, None, -2], dtype='Int64'),
+            'level': np.array([1, 2, 3, 4, 5, 6], dtype='int32'),
+            'big': np.array([2**62, 2**62 + 1, 2**63 - 1, 0, 1, 2], dtype='int64'),
+        })
+        self.rules = [
+            range_rule('age', 0, 150),
+            range_rule('height', 0.0, 2.0),
+            range_rule('visits', 0, 10),
+            range_rule('level', max_value=4),
+            range_rule('age', min_value=1),
+            range_rule('big', max_value=2**62),
+            range_rule('missing', 0, 1),
+        ]
+
+    def test_matches_per_rule_execution(self):
+        compiled = self.assessor.compile_rules(self.rules)(self.df)
+        self.assertEqual(len(compiled), len(self.rules))
+        for rule, actual in zip(self.rules, compiled):
+            expected = self.assessor._check_value_range(self.df, rule)
+            self.assertEqual(actual.to_dict(), expected.to_dict(), rule.column)
+
+    def test_large_integers_compare_exactly(self):
+        result = self.assessor.compile_rules([range_rule('big', max_value=2**62)])(self.df)[0]
+        self.assertEqual(result.failed_count, 2)
+        self.assertEqual(result.sample_failed_values, [2**62 + 1, 2**63 - 1])
+
+    def test_missing_column(self):
+        result = self.assessor.compile_rules([range_rule('missing', 0, 1)])(self.df)[0]
+        self.assertFalse(result.passed)
+        self.assertEqual(result.message, "Column 'missing' not found")
+
+
+if __name__ == '__main__':
+    unittest.main()
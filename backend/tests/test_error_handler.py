@@ -0,0 +1,131 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from etl.error_handler import DataQualityValidator, DeadLetterQueue, SCAN_HEAD_SIZE, _scan_csv
+
+
+class DeadLetterQueueTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.dlq = DeadLetterQueue(base_path=str(self.root / "data"))
+
+    def tearDown(self):
+        self.dlq.close()
+        self._tmp.cleanup()
+
+    def make_input(self, name):
+        path = self.root / name
+        path.write_text("user_id,age\n1,30\n")
+        return str(path)
+
+    def index_records(self):
+        if not self.dlq.index_path.exists():
+            return []
+        return [json.loads(line) for line in self.dlq.index_path.read_text().splitlines()]
+
+    def test_index_count_and_legacy_sidecars(self):
+        # A file quarantined before the index existed: data file plus .error sidecar
+        legacy = self.dlq.deadletter_path / "20240101_000000_legacy.csv"
+        legacy.write_text("user_id\n1\n")
+        Path(f"{legacy}.error").write_text(json.dumps({
+            "original_file": "input/legacy.csv",
+            "error_stage": "extract",
+            "error_message": "bad header",
+        }))
+        self.assertEqual(self.dlq.quarantined_count, 1)
+
+        # Outside a batch each record reaches the index right away
+        first = self.dlq.quarantine_file(self.make_input("first.csv"), {"stage": "extract", "error": "boom"})
+        self.assertTrue(Path(first).exists())
+        self.assertEqual([r["quarantine_file"] for r in self.index_records()], [Path(first).name])
+
+        # Inside a batch records are flushed when the outermost block exits
+        with self.dlq.batch():
+            with self.dlq.batch():
+                second = self.dlq.quarantine_file(self.make_input("second.csv"), {"error": "e2"})
+            self.assertEqual(len(self.index_records()), 1)
+            third = self.dlq.quarantine_file(self.make_input("third.csv"), {"error": "e3"})
+        records = self.index_records()
+        self.assertEqual([r["quarantine_file"] for r in records],
+                         [Path(p).name for p in (first, second, third)])
+        self.assertEqual(records[0]["error_stage"], "extract")
+        self.assertEqual(records[0]["error_message"], "boom")
+        self.assertEqual(records[1]["error_stage"], "unknown")
+        self.assertEqual(records[0]["file_size"], Path(first).stat().st_size)
+        # No sidecars are written unless verbose_metadata is set
+        self.assertEqual([p.name for p in self.dlq.deadletter_path.glob("*.error")],
+                         ["20240101_000000_legacy.csv.error"])
+
+        self.assertEqual(self.dlq.quarantined_count, 4)
+        listed = self.dlq.get_quarantined_files()
+        self.assertEqual(len(listed), 4)
+        self.assertIn("input/legacy.csv", [m.get("original_file") for m in listed])
+
+        # A fresh queue recounts the same records from disk
+        self.assertEqual(DeadLetterQueue(base_path=str(self.root / "data")).quarantined_count, 4)
+        self.dlq.reset_quarantined_count()
+        self.assertEqual(self.dlq.quarantined_count, 4)
+
+    def test_missing_file_is_not_counted(self):
+        self.assertEqual(self.dlq.quarantine_file(str(self.root / "nope.csv"), {"error": "x"}), "")
+        self.assertEqual(self.dlq.quarantined_count, 0)
+        self.assertEqual(self.index_records(), [])
+
+
+
+class ScanCsvTest(unittest.TestCase):
+    """_scan_csv and validate_file against what pd.read_csv accepts"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "input.csv"
+        self.validator = DataQualityValidator()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, data):
+        self.path.write_bytes(data)
+        return self.path
+
+    def test_empty_file(self):
+        self.assertEqual(_scan_csv(self.write(b"")), ([], [], 0))
+        result = self.validator.validate_file(str(self.path))
+        self.assertFalse(result['is_valid'])
+        self.assertIn("Empty CSV file", result['issues'])
+
+    def test_missing_trailing_newline(self):
+        header, sample, line_count = _scan_csv(self.write(b"user_id,age\n1,30\n2,40"))
+        self.assertEqual(header, ['user_id', 'age'])
+        self.assertEqual(sample, [['1', '30'], ['2', '40']])
+        self.assertEqual(line_count, 3)
+        self.assertEqual(_scan_csv(self.write(b"user_id,age\n1,30\n2,40\n"))[2], 3)
+
+    def test_extra_field_on_first_row_is_an_index_column(self):
+        self.write(b"user_id,age\n0,1,30\n1,2,40\n")
+        result = self.validator.validate_file(str(self.path))
+        self.assertTrue(result['is_valid'], result['issues'])
+
+    def test_overlong_sample_row_is_malformed(self):
+        self.write(b"user_id,age\n1,30\n2,40,extra\n")
+        result = self.validator.validate_file(str(self.path))
+        self.assertFalse(result['is_valid'])
+        self.assertIn("CSV parsing error - malformed CSV", result['issues'])
+
+    def test_header_longer_than_first_block(self):
+        columns = [f"column_{i:07d}" for i in range(SCAN_HEAD_SIZE // 10)]
+        row = ",".join("1" for _ in columns)
+        self.write((",".join(columns) + "\n" + row + "\n" + row + "\n").encode())
+        header, sample, line_count = _scan_csv(self.path)
+        self.assertEqual(header, columns)
+        self.assertEqual(len(sample), 2)
+        self.assertEqual(line_count, 3)
+        result = self.validator.validate_file(str(self.path))
+        self.assertTrue(result['is_valid'], result['issues'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from etl.extractor import _read_csv, _read_csv_arrow, pa
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class ArrowCsvReaderTest(unittest.TestCase):
+    """The Arrow reader must give what pd.read_csv gives, or defer to it"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write_csv(self, text):
+        path = Path(self._tmp.name) / "input.csv"
+        path.write_text(text)
+        return path
+
+    def assert_matches_pandas(self, path):
+        extracted = _read_csv(path)
+        expected = pd.read_csv(path)
+        # transform turns user_id into text, which is what has to agree
+        if 'user_id' in expected.columns:
+            pd.testing.assert_series_equal(extracted.pop('user_id').astype(str),
+                                           expected.pop('user_id').astype(str))
+        pd.testing.assert_frame_equal(extracted, expected)
+
+    def test_repeated_header_falls_back_to_pandas(self):
+        path = self.write_csv("user_id,a,a\n1,2,3\n4,5,6\n")
+        self.assertIsNone(_read_csv_arrow(path))
+        self.assert_matches_pandas(path)
+
+    def test_integer_wider_than_int64_falls_back_to_pandas(self):
+        path = self.write_csv("user_id,score\n1,99999999999999999999\n2,5\n")
+        self.assertIsNone(_read_csv_arrow(path))
+        self.assert_matches_pandas(path)
+
+    def test_wide_user_id_is_kept_exact(self):
+        path = self.write_csv("user_id,age\n99999999999999999999,30\n2,40\n")
+        self.assertEqual(_read_csv_arrow(path)['user_id'][0], "99999999999999999999")
+        self.assert_matches_pandas(path)
+
+    def test_times_stay_text(self):
+        path = self.write_csv("user_id,start,end\n1,12:30:00,12:30\n2,01:00:00,\n")
+        self.assert_matches_pandas(path)
+
+    def test_dates_and_nulls_match(self):
+        path = self.write_csv("user_id,age,sign_up_date,is_active\n"
+                              "1,30,2024-01-01,True\n2,NA,,False\n3,,2024-02-29,\n")
+        self.assert_matches_pandas(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
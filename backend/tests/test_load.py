@@ -0,0 +1,67 @@
+import csv
+import io
+import unittest
+
+import numpy as np
+import pandas as pd
+
+try:
+    from etl.load import _to_staging_frame, _to_copy_payload
+except ImportError:
+    _to_staging_frame = None
+
+
+def read_payload(payload):
+    """Rows of a COPY CSV payload, as the server would split them"""
+    data = payload.getvalue()
+    if isinstance(data, bytes):
+        data = data.decode()
+    return list(csv.reader(io.StringIO(data)))
+
+
+@unittest.skipIf(_to_staging_frame is None, "sqlalchemy/psycopg2 are not installed")
+class StagingFrameTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'user_id': ['a,1', 'b"q', 3, 'a,1'],
+            'age': [30.7, None, 40.0, 41.0],
+            'sign_up_date': pd.to_datetime(['2024-01-01', None, '2024-03-01', '2024-04-01']),
+            'is_active': [True, None, False, True],
+        })
+        self.staged = _to_staging_frame(self.df)
+
+    def test_column_types(self):
+        self.assertEqual(list(self.staged.columns),
+                         ['row_order', 'user_id', 'age', 'sign_up_date', 'is_active'])
+        self.assertEqual(self.staged['age'].dtype, pd.Int32Dtype())
+        self.assertEqual(self.staged['is_active'].dtype, np.dtype(bool))
+        self.assertEqual(self.staged['user_id'].tolist(), ['a,1', 'b"q', '3', 'a,1'])
+
+    def test_ages_truncate_and_keep_nulls(self):
+        self.assertEqual(self.staged['age'][0], 30)
+        self.assertTrue(pd.isna(self.staged['age'][1]))
+
+    def test_missing_is_active_becomes_false(self):
+        self.assertEqual(self.staged['is_active'].tolist(), [True, False, False, True])
+
+    def test_payload_quotes_user_ids_and_leaves_nulls_empty(self):
+        rows = read_payload(_to_copy_payload(self.staged))
+        self.assertEqual([row[1] for row in rows], ['a,1', 'b"q', '3', 'a,1'])
+        # Empty unquoted fields are NULL in COPY CSV
+        self.assertEqual(rows[1][2:4], ['', ''])
+        self.assertTrue(rows[0][3].startswith('2024-01-01'))
+        # pyarrow writes true/false, pandas True/False; PostgreSQL takes both
+        self.assertEqual([row[4].lower() for row in rows], ['true', 'false', 'false', 'true'])
+
+    def test_last_row_per_user_id_wins(self):
+        rows = read_payload(_to_copy_payload(self.staged))
+        self.assertEqual([int(row[0]) for row in rows], list(range(len(self.df))))
+        # The upsert keeps the highest row_order per user_id (DISTINCT ON ... DESC)
+        kept = {}
+        for row in sorted(rows, key=lambda row: int(row[0]), reverse=True):
+            kept.setdefault(row[1], row)
+        self.assertEqual(kept['a,1'][2], '41')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from etl import monitoring
+from etl.monitoring import AlertingSystem, MetricsCollector
+
+
+class MetricsAndAlertFilesTest(unittest.TestCase):
+    def setUp(self):
+        # Alert files are written under logs/alerts relative to the cwd
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.metrics_dir = Path("logs/metrics")
+        self.date_str = datetime.now().strftime("%Y%m%d")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def read_jsonl(self, path):
+        return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+    def run_and_read_back(self):
+        collector = MetricsCollector(metrics_dir=str(self.metrics_dir))
+        alerting = AlertingSystem()
+        try:
+            # A day file from before the JSONL switch: one JSON list
+            self.metrics_dir.mkdir(parents=True, exist_ok=True)
+            legacy = [
+                {"pipeline_id": "old_ok", "status": "success", "rows_processed": 5, "execution_time_seconds": 1.0},
+                {"pipeline_id": "old_bad", "status": "failed", "rows_processed": 0, "execution_time_seconds": 2.0},
+            ]
+            (self.metrics_dir / f"pipeline_metrics_{self.date_str}.json").write_text(json.dumps(legacy))
+
+            collector.start_pipeline_tracking("run_ok", "data/input/ok.csv")
+            collector.update_stage("run_ok", "load", 10)
+            collector.finish_pipeline_tracking("run_ok", "success")
+            collector.start_pipeline_tracking("run_bad", "data/input/naïve.csv")
+            failed = collector.finish_pipeline_tracking("run_bad", "failed", "bad ☃ \"row\"")
+
+            alerting.send_alert("PIPELINE_FAILURE", "bad row", failed)
+            alerting.send_alert("BATCH_COMPLETION", "1/2 successful")
+
+            collector.flush()
+            alerting.flush()
+
+            metrics = self.read_jsonl(self.metrics_dir / f"pipeline_metrics_{self.date_str}.jsonl")
+            self.assertEqual([m["pipeline_id"] for m in metrics], ["run_ok", "run_bad"])
+            self.assertEqual(metrics[0]["rows_processed"], 10)
+            self.assertEqual(metrics[0]["stage"], "load")
+            self.assertEqual(metrics[1]["file_path"], "data/input/naïve.csv")
+            self.assertEqual(metrics[1]["error_message"], "bad ☃ \"row\"")
+            self.assertIsNotNone(metrics[1]["end_time"])
+
+            summary = collector.get_daily_summary()
+            self.assertEqual(summary["total_runs"], 4)
+            self.assertEqual(summary["successful_runs"], 2)
+            self.assertEqual(summary["total_rows_processed"], 15)
+            self.assertEqual([m["pipeline_id"] for m in summary["failed_pipelines"]], ["old_bad", "run_bad"])
+
+            alerts = self.read_jsonl(Path("logs/alerts") / f"alerts_{self.date_str}.jsonl")
+            self.assertEqual([a["alert_type"] for a in alerts], ["PIPELINE_FAILURE", "BATCH_COMPLETION"])
+            self.assertEqual(alerts[0]["pipeline_metrics"]["pipeline_id"], "run_bad")
+            self.assertIsNone(alerts[1]["pipeline_metrics"])
+        finally:
+            collector.close()
+            alerting.close()
+
+    def test_round_trip(self):
+        self.run_and_read_back()
+
+    def test_round_trip_without_orjson(self):
+        with mock.patch.object(monitoring, "orjson", None):
+            self.run_and_read_back()
+
+
+if __name__ == '__main__':
+    unittest.main()
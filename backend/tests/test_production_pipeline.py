@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import sqlalchemy
+except ImportError:
+    sqlalchemy = None
+
+
+@unittest.skipIf(sqlalchemy is None, "sqlalchemy is not installed")
+class BatchSplitThresholdTest(unittest.TestCase):
+    def setUp(self):
+        # The pipeline keeps its data, logs and schema registry under the cwd
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        Path("input").mkdir()
+
+        from etl.production_pipeline import ProductionETLPipeline
+        self.pipeline = ProductionETLPipeline({'batch_workers': 1})
+        self.pipeline._load = lambda clean_data: {'success': True, 'rows_loaded': len(clean_data)}
+        self.pipeline._get_health_status = lambda: {'overall_status': 'healthy'}
+
+    def tearDown(self):
+        self.pipeline.metrics_collector.close()
+        self.pipeline.alerting_system.close()
+        self.pipeline.dlq.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_file_over_validator_limit_is_streamed_not_quarantined(self):
+        rows = "".join(f"{i},{20 + i % 50},2024-01-01,1\n" for i in range(500))
+        Path("input/large.csv").write_text("user_id,age,sign_up_date,is_active\n" + rows)
+        # ~13KB file against a ~1KB cap
+        self.pipeline.data_validator.validation_rules['max_file_size_mb'] = 0.001
+
+        with mock.patch.object(self.pipeline, '_run_stages_chunked',
+                               wraps=self.pipeline._run_stages_chunked) as chunked:
+            result = self.pipeline.run_batch_pipeline("input", "*.csv", {'skip_schema_evolution': True})
+
+        self.assertTrue(result['success'], result['detailed_results'])
+        self.assertEqual(result['total_rows_processed'], 500)
+        chunked.assert_called_once()
+        self.assertEqual(self.pipeline.dlq.quarantined_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()